@@ -8,28 +8,34 @@ import json
 import os
 from pathlib import Path
 
-def create_condensed_foreign_affairs():
-    """Create condensed version of foreign affairs data."""
+def create_condensed_foreign_affairs(data=None):
+    """Create condensed version of foreign affairs data.
+    
+    Pass the already-loaded detailed data as `data` to skip re-reading it from disk.
+    """
     
     print("📂 Creating condensed foreign affairs data file...")
     
-    # Get paths
-    script_dir = Path(__file__).parent
+    # Get paths (resolved, since callers import this module via "<script dir>/..")
+    script_dir = Path(__file__).resolve().parent
     project_root = script_dir.parent
     public_data_dir = project_root / "public" / "data"
     
     source_file = public_data_dir / "enhanced_foreign_affairs_data_detailed.json"
     target_file = public_data_dir / "foreign_affairs_data_condensed.json"
     
-    # Check if source file exists
-    if not source_file.exists():
-        print(f"❌ Source file not found: {source_file}")
-        return False
-    
-    # Load the full data
-    print(f"📖 Loading data from: {source_file}")
-    with open(source_file, 'r', encoding='utf-8') as f:
-        full_data = json.load(f)
+    if data is not None:
+        full_data = data
+    else:
+        # Check if source file exists
+        if not source_file.exists():
+            print(f"❌ Source file not found: {source_file}")
+            return False
+        
+        # Load the full data
+        print(f"📖 Loading data from: {source_file}")
+        with open(source_file, 'r', encoding='utf-8') as f:
+            full_data = json.load(f)
     
     # Create condensed structure
     condensed_data = {
@@ -59,13 +65,14 @@ def create_condensed_foreign_affairs():
     with open(target_file, 'w', encoding='utf-8') as f:
         json.dump(condensed_data, f, indent=2, ensure_ascii=False)
     
-    # Calculate size reduction
-    source_size = source_file.stat().st_size
-    target_size = target_file.stat().st_size
-    reduction_percent = ((source_size - target_size) / source_size) * 100
-    
     print(f"✅ Condensed file created successfully!")
-    print(f"📊 File size reduction: {source_size:,} bytes → {target_size:,} bytes ({reduction_percent:.1f}% smaller)")
+    
+    # Calculate size reduction
+    if source_file.exists():
+        source_size = source_file.stat().st_size
+        target_size = target_file.stat().st_size
+        reduction_percent = ((source_size - target_size) / source_size) * 100
+        print(f"📊 File size reduction: {source_size:,} bytes → {target_size:,} bytes ({reduction_percent:.1f}% smaller)")
     print(f"📁 Condensed file: {target_file}")
     
     return True
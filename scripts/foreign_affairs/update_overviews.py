@@ -10,10 +10,28 @@ import sys
 from datetime import datetime
 from typing import Dict, Any, List
 import re
+import queue
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import the AI system from affairs_ai.py
 from affairs_ai import ForeignAffairsEnhancer, load_api_keys_from_env
 
+# Same local-copy helper the collector uses for its output
+from foreign_affairs_data_collector import mirror_file
+
+# Optional faster JSON decoder/encoder for the (large) detailed data file
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def load_json_file(path: str) -> Dict[str, Any]:
+    """Load a JSON file, parsing the raw bytes with orjson when available"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
 def update_overview_fields_with_ai():
     """Update all overview fields using AI with Google Search."""
     
@@ -25,8 +43,21 @@ def update_overview_fields_with_ai():
         print("❌ No API keys found! Please set GEMINI_API_KEY_1, GEMINI_API_KEY_2, etc. in your environment.")
         return
     
-    # Initialize the AI enhancer
-    enhancer = ForeignAffairsEnhancer(api_keys)
+    # Initialize one AI enhancer per API key so requests can run in parallel; each starts on a
+    # different key and rotates through the rest on its own when a key is exhausted
+    enhancers = [ForeignAffairsEnhancer(api_keys[i:] + api_keys[:i]) for i in range(len(api_keys))]
+    enhancer = enhancers[0]
+    enhancer_pool = queue.Queue()
+    for pooled in enhancers:
+        enhancer_pool.put(pooled)
+    
+    def with_enhancer(func, *args):
+        """Run func with an enhancer checked out of the pool"""
+        pooled = enhancer_pool.get()
+        try:
+            return func(pooled, *args)
+        finally:
+            enhancer_pool.put(pooled)
     
     # Load the current data
     print("📂 Loading current data...")
@@ -38,13 +69,11 @@ def update_overview_fields_with_ai():
     public_file = os.path.join(public_data_dir, 'enhanced_foreign_affairs_data_detailed.json')
     
     if os.path.exists(public_file):
-        with open(public_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(public_file)
         print("✅ Loaded data from public/data directory")
     else:
         # Fallback to local directory
-        with open('enhanced_foreign_affairs_data_detailed.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file('enhanced_foreign_affairs_data_detailed.json')
         print("✅ Loaded data from local directory")
     
     # Load source data for context
@@ -54,67 +83,92 @@ def update_overview_fields_with_ai():
     
     # Update country overviews
     if 'enhanced_bilateral_relations' in data:
-        for country_code, country_data in data['enhanced_bilateral_relations'].items():
-            country_name = country_data.get('country_name', country_code)
+        def generate_country_overview(pooled, country_code, country_data, country_name):
             print(f"\n📝 Generating AI overview for {country_name}...")
+            return pooled.enhance_country_full(country_code, country_data, country_name, source_data)
+        
+        with ThreadPoolExecutor(max_workers=len(api_keys)) as executor:
+            futures = {}
+            for country_code, country_data in data['enhanced_bilateral_relations'].items():
+                country_name = country_data.get('country_name', country_code)
+                future = executor.submit(with_enhancer, generate_country_overview, country_code, country_data, country_name)
+                futures[future] = (country_data, country_name)
             
-            try:
-                # Use the AI system to generate a fresh overview
-                enhanced_country = enhancer.enhance_country_full(country_code, country_data, country_name, source_data)
-                
-                # Update only the overview field
-                if 'detailed_relationship_summary' in enhanced_country:
-                    old_summary = country_data.get('detailed_relationship_summary', '')
-                    new_summary = enhanced_country['detailed_relationship_summary']
+            for future in as_completed(futures):
+                country_data, country_name = futures[future]
+                try:
+                    # Use the AI system to generate a fresh overview
+                    enhanced_country = future.result()
                     
-                    if new_summary and new_summary != old_summary:
-                        country_data['detailed_relationship_summary'] = new_summary
-                        print(f"✅ Updated overview for {country_name}")
-                    else:
-                        print(f"⚠️ No changes for {country_name}")
-                
-            except Exception as e:
-                print(f"❌ Error updating {country_name}: {e}")
+                    # Update only the overview field
+                    if 'detailed_relationship_summary' in enhanced_country:
+                        old_summary = country_data.get('detailed_relationship_summary', '')
+                        new_summary = enhanced_country['detailed_relationship_summary']
+                        
+                        if new_summary and new_summary != old_summary:
+                            country_data['detailed_relationship_summary'] = new_summary
+                            print(f"✅ Updated overview for {country_name}")
+                        else:
+                            print(f"⚠️ No changes for {country_name}")
+                    
+                except Exception as e:
+                    print(f"❌ Error updating {country_name}: {e}")
     
     # Update regional overviews
     if 'enhanced_regional_analysis' in data:
-        for region_key, region_data in data['enhanced_regional_analysis'].items():
+        # Group countries by region once instead of scanning every country for each region
+        region_index = defaultdict(list)
+        for country_data in data.get('enhanced_bilateral_relations', {}).values():
+            region_index[country_data.get('region')].append(country_data)
+        
+        # Build the diplomatic and bilateral context for each region up front (plain data lookups, no AI calls)
+        enhanced_regional = data.get('enhanced_regional_analysis', {})
+        region_contexts = {}
+        for region_key, region_data in enhanced_regional.items():
             region_name = region_data.get('region_name', region_key)
+            if region_name not in region_contexts:
+                region_contexts[region_name] = (
+                    enhancer.get_regional_diplomatic_feeds_context(source_data, region_name),
+                    enhancer.get_regional_bilateral_context(enhanced_regional, region_index.get(region_name, []))
+                )
+        
+        def generate_region_overview(pooled, region_name, region_data):
             print(f"\n🌍 Generating AI overview for {region_name}...")
+            diplomatic_context, bilateral_context = region_contexts[region_name]
+            
+            # Use the AI system to generate a fresh regional overview
+            return pooled.enhance_region_full(region_name, region_data, diplomatic_context, bilateral_context)
+        
+        with ThreadPoolExecutor(max_workers=len(api_keys)) as executor:
+            futures = {}
+            for region_key, region_data in data['enhanced_regional_analysis'].items():
+                region_name = region_data.get('region_name', region_key)
+                future = executor.submit(with_enhancer, generate_region_overview, region_name, region_data)
+                futures[future] = (region_data, region_name)
             
-            try:
-                # Get diplomatic context for the region
-                diplomatic_context = enhancer.get_regional_diplomatic_feeds_context(source_data, region_name)
-                
-                # Get bilateral context for countries in this region
-                regional_countries = []
-                if 'enhanced_bilateral_relations' in data:
-                    for country_code, country_data in data['enhanced_bilateral_relations'].items():
-                        if country_data.get('region') == region_name:
-                            regional_countries.append(country_data)
-                
-                bilateral_context = enhancer.get_regional_bilateral_context(data.get('enhanced_regional_analysis', {}), regional_countries)
-                
-                # Use the AI system to generate a fresh regional overview
-                enhanced_region = enhancer.enhance_region_full(region_name, region_data, diplomatic_context, bilateral_context)
-                
-                # Update only the overview field
-                if 'comprehensive_regional_overview' in enhanced_region:
-                    old_overview = region_data.get('comprehensive_regional_overview', '')
-                    new_overview = enhanced_region['comprehensive_regional_overview']
+            for future in as_completed(futures):
+                region_data, region_name = futures[future]
+                try:
+                    enhanced_region = future.result()
                     
-                    if new_overview and new_overview != old_overview:
-                        region_data['comprehensive_regional_overview'] = new_overview
-                        print(f"✅ Updated overview for {region_name}")
-                    else:
-                        print(f"⚠️ No changes for {region_name}")
-                
-            except Exception as e:
-                print(f"❌ Error updating {region_name}: {e}")
-    
-    # Update metadata
+                    # Update only the overview field
+                    if 'comprehensive_regional_overview' in enhanced_region:
+                        old_overview = region_data.get('comprehensive_regional_overview', '')
+                        new_overview = enhanced_region['comprehensive_regional_overview']
+                        
+                        if new_overview and new_overview != old_overview:
+                            region_data['comprehensive_regional_overview'] = new_overview
+                            print(f"✅ Updated overview for {region_name}")
+                        else:
+                            print(f"⚠️ No changes for {region_name}")
+                    
+                except Exception as e:
+                    print(f"❌ Error updating {region_name}: {e}")
+    
+    # Update metadata (one timestamp for the whole update)
+    update_time = datetime.now()
     if 'metadata' in data:
-        data['metadata']['last_overview_update'] = datetime.now().isoformat()
+        data['metadata']['last_overview_update'] = update_time.isoformat()
         data['metadata']['overview_update_note'] = "Overview fields updated via AI with Google Search"
     
     # Save the updated data
@@ -128,14 +182,19 @@ def update_overview_fields_with_ai():
     # Create the directory if it doesn't exist
     os.makedirs(public_data_dir, exist_ok=True)
     
+    # Compact JSON - the detailed file is only read by scripts and the app
+    if orjson:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
     public_file = os.path.join(public_data_dir, 'enhanced_foreign_affairs_data_detailed.json')
-    with open(public_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(public_file, 'wb') as f:
+        f.write(payload)
     print(f"✅ Data saved to: {public_file}")
     
-    # Also save to local directory for backward compatibility
-    with open('enhanced_foreign_affairs_data_detailed.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Also save to local directory for backward compatibility (linked/copied, not re-written)
+    mirror_file(public_file, 'enhanced_foreign_affairs_data_detailed.json')
     print(f"✅ Data also saved locally")
     
     # Create condensed version for frontend
@@ -144,7 +203,7 @@ def update_overview_fields_with_ai():
         import sys
         sys.path.append(os.path.join(script_dir, '..'))
         from create_condensed_foreign_affairs import create_condensed_foreign_affairs
-        create_condensed_foreign_affairs()
+        create_condensed_foreign_affairs(data=data)
     except Exception as e:
         print(f"⚠️  Warning: Could not create condensed version: {e}")
     
@@ -152,7 +211,7 @@ def update_overview_fields_with_ai():
     print(f"🤖 AI system used: Google Gemini 2.0 Flash with Google Search")
     print(f"📁 File updated: enhanced_foreign_affairs_data_detailed.json")
     print(f"📁 Condensed file: foreign_affairs_data_condensed.json")
-    print(f"🕒 Update timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"🕒 Update timestamp: {update_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"\n💡 The AI has generated fresh, current overviews using real-time information from trustworthy sources.")
 
 if __name__ == "__main__":
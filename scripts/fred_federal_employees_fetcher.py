@@ -14,58 +14,55 @@ Usage:
 """
 
 import os
+import gzip
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
 
+# Optional faster JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Shared session: reuses the FRED connection across calls and retries transient failures with backoff
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(max_retries=Retry(total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])))
+
+# Seconds to wait on a FRED request before giving up
+REQUEST_TIMEOUT = 10
+
 def load_env_file():
-    """Load environment variables from .env file if it exists."""
-    # Look for .env file in the project root (nextjs-political-dashboard directory)
-    env_file = Path(__file__).parent.parent / '.env'
-    print(f"Looking for .env file at: {env_file}")
-    
-    if env_file.exists():
-        print(f"Found .env file at: {env_file}")
-        with open(env_file, 'r') as f:
-            content = f.read()
-            print(f"Raw .env file content: {repr(content)}")
-            
-        with open(env_file, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                print(f"Line {line_num}: {repr(line)}")
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        os.environ[key] = value
-                        print(f"Loaded environment variable: {key} = {value}")
-                    else:
-                        print(f"Warning: Invalid line format at line {line_num}: {line}")
-                else:
-                    print(f"Skipping line {line_num}: {repr(line)}")
-    else:
-        print(f".env file not found at: {env_file}")
-        # Also try looking in the current working directory
-        cwd_env = Path.cwd() / '.env'
-        print(f"Also checking: {cwd_env}")
-        if cwd_env.exists():
-            print(f"Found .env file at: {cwd_env}")
-            with open(cwd_env, 'r') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        if '=' in line:
-                            key, value = line.split('=', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            os.environ[key] = value
-                            print(f"Loaded environment variable: {key} = {value}")
-                        else:
-                            print(f"Warning: Invalid line format at line {line_num}: {line}")
+    """Load environment variables from .env file if it exists (set DEBUG_ENV=1 for per-key diagnostics)."""
+    debug = bool(os.environ.get('DEBUG_ENV'))
+    
+    # Look for .env file in the project root (nextjs-political-dashboard directory), then the working directory
+    candidates = (Path(__file__).parent.parent / '.env', Path.cwd() / '.env')
+    env_file = next((path for path in candidates if path.exists()), None)
+    if env_file is None:
+        print(f".env file not found (checked: {', '.join(str(path) for path in candidates)})")
+        return
+    
+    loaded = 0
+    for line_num, line in enumerate(env_file.read_text().splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if '=' not in line:
+            print(f"Warning: Invalid line format at line {line_num} of {env_file}")
+            continue
+        key, value = line.split('=', 1)
+        os.environ[key.strip()] = value.strip()
+        loaded += 1
+        if debug:
+            print(f"Loaded environment variable: {key.strip()}")
+    
+    print(f"Loaded {loaded} environment variables from {env_file}")
 
 def fetch_fred_data(api_key, series_id, start_date, end_date):
     """
@@ -92,7 +89,7 @@ def fetch_fred_data(api_key, series_id, start_date, end_date):
     }
     
     try:
-        response = requests.get(base_url, params=params)
+        response = SESSION.get(base_url, params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -119,7 +116,7 @@ def get_series_info(api_key, series_id):
     }
     
     try:
-        response = requests.get(base_url, params=params)
+        response = SESSION.get(base_url, params=params, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -155,16 +152,18 @@ def main():
     
     print(f"Fetching data for series {series_id} from {start_date_str} to {end_date_str}")
     
-    # Get series information
-    print("Fetching series information...")
-    series_info = get_series_info(api_key, series_id)
+    # Get series information and the observation data concurrently (independent requests)
+    print("Fetching series information and observation data...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        series_info_future = executor.submit(get_series_info, api_key, series_id)
+        data_future = executor.submit(fetch_fred_data, api_key, series_id, start_date_str, end_date_str)
+        series_info = series_info_future.result()
+        data = data_future.result()
+    
     if not series_info:
         print("Failed to fetch series information")
         sys.exit(1)
     
-    # Fetch the data
-    print("Fetching observation data...")
-    data = fetch_fred_data(api_key, series_id, start_date_str, end_date_str)
     if not data:
         print("Failed to fetch data")
         sys.exit(1)
@@ -188,19 +187,32 @@ def main():
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     output_file = output_dir / f'federal_employees_data_{timestamp}.json'
     
-    # Save data to JSON file
+    # Save data to JSON file (compact; serialized once for both copies)
     try:
-        with open(output_file, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        if orjson:
+            payload = orjson.dumps(output_data)
+        else:
+            payload = json.dumps(output_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
         
-        print(f"Data successfully saved to: {output_file}")
+        # Standard name for easy access
+        # (unlinked first so an earlier timestamped hardlink to it is left untouched)
+        standard_file = output_dir / 'federal_employees_data.json'
+        standard_file.unlink(missing_ok=True)
+        standard_file.write_bytes(payload)
+        print(f"Data successfully saved to: {standard_file}")
         print(f"Number of observations: {len(data.get('observations', []))}")
         
-        # Also save a copy with a standard name for easy access
-        standard_file = output_dir / 'federal_employees_data.json'
-        with open(standard_file, 'w') as f:
-            json.dump(output_data, f, indent=2)
-        print(f"Data also saved to: {standard_file}")
+        # Timestamped copy: gzip-compressed when FRED_GZIP is set, otherwise a hardlink to the standard file
+        if os.environ.get('FRED_GZIP'):
+            output_file = output_file.with_name(output_file.name + '.gz')
+            with gzip.open(output_file, 'wb', compresslevel=3) as f:
+                f.write(payload)
+        else:
+            try:
+                os.link(standard_file, output_file)
+            except OSError:
+                output_file.write_bytes(payload)
+        print(f"Data also saved to: {output_file}")
         
     except Exception as e:
         print(f"Error saving data to file: {e}")
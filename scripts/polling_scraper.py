@@ -5,21 +5,338 @@ Scrapes publicly available polling data from reputable sources where legally per
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import argparse
+import feedparser
 import json
 import time
 from datetime import datetime
 import logging
+import os
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
 from urllib.parse import urljoin, urlparse
 import re
 
+# Shared per-host rate limiter (package import under `python -m scripts.polling_scraper`, plain import otherwise)
+try:
+    from .rate_limiter import HostRateLimiter
+except ImportError:
+    from rate_limiter import HostRateLimiter
+
+# Optional faster JSON encoder for the output file
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional linear-time regex engine for scanning whole pages (falls back to the standard library)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Optional lxml for incremental HTML text scanning (falls back to stripping tags from the whole page)
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# Paths resolved once at import: this script's directory and the project's public/data output directory
+SCRIPT_DIR = Path(__file__).resolve().parent
+PUBLIC_DATA_DIR = SCRIPT_DIR.parent / 'public' / 'data'
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Optional on-disk HTTP cache with ETag/Last-Modified revalidation (falls back to a plain session)
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+    logger.info("requests-cache not installed - pages will be re-downloaded on every run")
+
+# Approval/disapproval patterns, compiled once and tried in priority order: "approve: 45%", "approval 45%",
+# "45% approve", "45% approval" - the first pattern that matches anywhere on the page decides the rating.
+# Gaps and numbers are bounded so no match is longer than _MAX_RATING_MATCH characters (see _RatingScanner);
+# 1000 is the largest repetition count re2 accepts, far beyond any label-to-number gap on a real page
+_MAX_GAP = 1000
+_PERCENT = r'\d{2,3}(?:\.\d{1,16})?'
+_PERCENT_LOOSE = r'\d{1,16}\.?\d{0,16}'
+_MAX_RATING_MATCH = len('disapproval') + _MAX_GAP + 33 + len('%')
+
+def _compile_rating_patterns(stem, percent):
+    # Inline (?i) rather than re.IGNORECASE - re2.compile takes no re-style flags
+    engine = re2 or re
+    return (
+        engine.compile(rf'(?i){stem}e[:\s]{{0,{_MAX_GAP}}}({percent})%'),
+        engine.compile(rf'(?i){stem}al[:\s]{{0,{_MAX_GAP}}}({percent})%'),
+        engine.compile(rf'(?i)({percent})%\s{{0,{_MAX_GAP}}}{stem}e'),
+        engine.compile(rf'(?i)({percent})%\s{{0,{_MAX_GAP}}}{stem}al'),
+    )
+
+_APPROVE_RES = _compile_rating_patterns('approv', _PERCENT)
+_DISAPPROVE_RES = _compile_rating_patterns('disapprov', _PERCENT)
+_APPROVE_RES_LOOSE = _compile_rating_patterns('approv', _PERCENT_LOOSE)
+_DISAPPROVE_RES_LOOSE = _compile_rating_patterns('disapprov', _PERCENT_LOOSE)
+
+def _rating(match):
+    """Percentage captured by an approval/disapproval pattern match"""
+    return float(match.group(1))
+
+# Markup to drop when only the visible text of a page is needed (script/style bodies and comments first)
+# (linear-time with re2 as well, so a page with an unterminated <script> cannot make the lazy scans quadratic)
+_TAG_RE = (re2 or re).compile(r'(?is)<script\b.*?</script\s*>|<style\b.*?</style\s*>|<!--.*?-->|<[^>]+>')
+
+def _page_text(html):
+    """Visible text of an HTML page for the rating regexes, without building a DOM - text nodes are
+    joined with nothing, as BeautifulSoup's get_text() does, so "<b>45</b>%" still reads as 45%"""
+    return unescape(_TAG_RE.sub('', html))
+
+class _RatingScanner:
+    """Feed an HTML document in chunks; collects the visible text and stops parsing as soon as both
+    ratings are settled by their top-priority pattern (lxml), or scans the whole page on finish()"""
+    
+    # Bytes fed between regex scans, and how far back each scan starts so a match split across scans is found
+    SCAN_EVERY = 16384
+    OVERLAP = _MAX_RATING_MATCH
+    
+    def __init__(self, approve_res=None, disapprove_res=None):
+        self.approve_res = approve_res or _APPROVE_RES
+        self.disapprove_res = disapprove_res or _DISAPPROVE_RES
+        self.approve_match = None
+        self.disapprove_match = None
+        # Priority index of each current match (len(patterns) while there is none)
+        self._approve_rank = len(self.approve_res)
+        self._disapprove_rank = len(self.disapprove_res)
+        self.text = ''
+        self._parts = []
+        self._skip = 0
+        self._mentioned = False
+        self._scanned = 0
+        self._pending = 0
+        self._raw = []
+        self._parser = etree.HTMLParser(target=self) if etree else None
+    
+    @property
+    def done(self):
+        return bool(self.approve_match and self.disapprove_match)
+    
+    @property
+    def settled(self):
+        """Both ratings matched by their top-priority pattern - nothing later on the page can change them"""
+        return self._approve_rank == 0 and self._disapprove_rank == 0
+    
+    def feed(self, chunk):
+        """Feed the next chunk of the page; returns True once both ratings are settled"""
+        if self._parser is None:
+            self._raw.append(chunk)
+            return False
+        self._parser.feed(chunk)
+        self._pending += len(chunk)
+        if self._pending >= self.SCAN_EVERY:
+            self._pending = 0
+            self._scan()
+        return self.settled
+    
+    def finish(self):
+        """Finish the document (if not stopped early) and run a final scan"""
+        if self._parser is None:
+            self._parts.append(_page_text(b''.join(self._raw).decode('utf-8', 'ignore')))
+        elif not self.settled:
+            try:
+                self._parser.close()
+            except etree.LxmlError:
+                pass  # e.g. an empty document - nothing to scan
+        self._scan()
+        return self.done
+    
+    def _scan(self):
+        if self._parts:
+            self.text += ''.join(self._parts)
+            self._parts.clear()
+        start = max(0, self._scanned - self.OVERLAP)
+        # Both patterns can only match together on text containing "disapprov" (which also contains
+        # "approv"), so a C-level substring check skips the regex scans until the word shows up -
+        # then the first scan starts from the top to pick up an earlier approval figure
+        if not self._mentioned:
+            if 'disapprov' not in self.text[start:].lower():
+                self._scanned = len(self.text)
+                return
+            self._mentioned = True
+            start = 0
+        # Only patterns ranked above the current match can still change it; each of them had no
+        # match in the text already scanned, so searching from the overlap is enough
+        self.approve_match, self._approve_rank = self._search(
+            self.approve_res, self.approve_match, self._approve_rank, start)
+        self.disapprove_match, self._disapprove_rank = self._search(
+            self.disapprove_res, self.disapprove_match, self._disapprove_rank, start)
+        self._scanned = len(self.text)
+    
+    def _search(self, patterns, match, rank, start):
+        for index in range(rank):
+            found = patterns[index].search(self.text, start)
+            if found:
+                return found, index
+        return match, rank
+    
+    # lxml parser target interface - text outside script/style blocks is joined with nothing, as in
+    # _page_text, so both paths see the same text
+    def start(self, tag, attrib):
+        if tag in ('script', 'style'):
+            self._skip += 1
+    
+    def end(self, tag):
+        if tag in ('script', 'style') and self._skip:
+            self._skip -= 1
+    
+    def data(self, data):
+        if not self._skip:
+            self._parts.append(data)
+    
+    def comment(self, text):
+        pass
+    
+    def close(self):
+        pass
+
+# Pages scraped for an approval/disapproval pair: the first URL that yields one wins. 'loose' uses the
+# looser number format, 'validate' rejects numbers outside 20-70%, and 'any_percentages' falls back
+# to the first two percentages on the page when no labelled rating is found
+APPROVAL_SOURCES = {
+    'real_clear_politics': {
+        'source': 'Real Clear Politics',
+        'urls': ("https://www.realclearpolitics.com/",),
+        'date': 'Current'
+    },
+    'five_thirty_eight': {
+        'source': 'FiveThirtyEight',
+        'urls': ("https://fivethirtyeight.com/",),
+        'date': 'Current',
+        'loose': True,
+        'any_percentages': True
+    },
+    'cnn': {
+        'source': 'CNN',
+        'urls': ("https://www.cnn.com/politics",),
+        'date': 'Current',
+        'loose': True,
+        'validate': False
+    },
+    'reuters_ipsos': {
+        'source': 'Reuters/Ipsos',
+        'urls': (
+            "https://www.reuters.com/data/trumps-approval-rating-2025-01-21/",
+            "https://www.reuters.com/commentary/breakingviews/donald-trump-is-weaker-than-he-looks-2025-08-31/",
+            "https://www.reuters.com/world/us/"
+        ),
+        'date': '2025-01-21'
+    },
+    'gallup': {
+        'source': 'Gallup',
+        'urls': ("https://news.gallup.com/poll/659534/trump-first-quarter-approval-rating-below-average.aspx",),
+        'date': '2025-04-17'
+    },
+    'rasmussen': {
+        'source': 'Rasmussen Reports',
+        'urls': ("https://www.rasmussenreports.com/public_content/politics/obama_administration/daily_presidential_tracking_poll",),
+        'date': '2025-01-21'
+    },
+    'morning_consult': {
+        'source': 'Morning Consult',
+        'urls': ("https://pro.morningconsult.com/trackers/donald-trump-approval-rating-by-state",),
+        'date': '2025-01-21'
+    },
+    'economist': {
+        'source': 'The Economist',
+        'urls': ("https://www.economist.com/interactive/trump-approval-tracker",),
+        'date': '2025-01-21'
+    }
+}
+
+# Published polls kept as fixed figures (no page to scrape), returned as copies by the scrape_*_poll methods
+STATIC_POLLS = {
+    'nytimes': {
+        'source': 'New York Times',
+        'approve': 41.0,
+        'disapprove': 57.5,
+        'unsure': 1.5,
+        'date': '2025-01-25',
+        'url': 'https://www.nytimes.com/interactive/2024/upshot/polls.html'
+    },
+    'cnbc': {
+        'source': 'CNBC',
+        'approve': 39.8,
+        'disapprove': 58.7,
+        'unsure': 1.5,
+        'date': '2025-01-28',
+        'url': 'https://www.cnbc.com/politics/'
+    },
+    'economist': {
+        'source': 'The Economist',
+        'approve': 40.2,
+        'disapprove': 57.3,
+        'unsure': 2.5,
+        'date': '2025-01-30',
+        'url': 'https://www.economist.com/graphic-detail'
+    }
+}
+
+_ANY_PERCENT_RE = (re2 or re).compile(r'(\d+\.?\d*)%')
+
+def _poll_entry(source, approve, disapprove, date, url):
+    return {
+        'source': source,
+        'approve': approve,
+        'disapprove': disapprove,
+        'unsure': max(0, 100 - approve - disapprove),
+        'date': date,
+        'url': url
+    }
+
+# Concurrent article fetches allowed against pewresearch.org
+PEW_ARTICLE_WORKERS = 4
+
+# Validators of the last Pew RSS download and the result it produced, so an unchanged feed is a 304
+PEW_FEED_CACHE = SCRIPT_DIR / "pew_feed_cache.json"
+
+def _load_feed_cache(path):
+    """Saved feed validators/result, or {} when there is no usable cache file"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_feed_cache(path, response, polling_data):
+    """Remember the feed's ETag/Last-Modified together with the result scraped from it"""
+    etag = response.headers.get('ETag')
+    modified = response.headers.get('Last-Modified')
+    if not (etag or modified):
+        return
+    try:
+        with open(path, 'w') as f:
+            json.dump({'etag': etag, 'modified': modified, 'polling_data': polling_data}, f)
+    except OSError as e:
+        logger.warning(f"Could not save feed cache {path}: {e}")
+
 class LegalPollingScraper:
     def __init__(self):
-        self.session = requests.Session()
+        # The default 'Cache-Control: max-age=0' request header below makes every cached page
+        # revalidate, so repeat runs send conditional GETs and skip the download on a 304
+        if requests_cache:
+            cache_name = str(SCRIPT_DIR / "polling_http_cache")
+            self.session = requests_cache.CachedSession(
+                cache_name,
+                backend="sqlite",
+                expire_after=3600,
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
@@ -33,6 +350,23 @@ class LegalPollingScraper:
             'Cache-Control': 'max-age=0'
         })
         
+        # Pooled keep-alive connections with retry/backoff on transient failures
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Per-host politeness: at most 2 requests/second to any one site
+        self.rate_limiter = HostRateLimiter(rate=2.0, burst=2)
+        
+    def _get(self, url, **kwargs):
+        """GET through the shared session once the host's rate limit allows it"""
+        self.rate_limiter.acquire(url)
+        return self.session.get(url, **kwargs)
+        
     def scrape_pew_research(self):
         """
         Scrape Pew Research Center for publicly available polling data
@@ -41,88 +375,76 @@ class LegalPollingScraper:
         try:
             # Try Pew's RSS feed which is more likely to be accessible
             url = "https://www.pewresearch.org/feed/"
-            response = self.session.get(url, timeout=15)
+            
+            # Conditional GET against the last run's validators: an unchanged feed lists the
+            # same articles, so the result saved with it is reused without fetching them again.
+            # 'no-store' keeps the feed out of the requests-cache session (per request, unlike the
+            # session-wide cache_disabled()), which would otherwise answer a 304 with its cached 200
+            feed_cache = _load_feed_cache(PEW_FEED_CACHE)
+            headers = {'Cache-Control': 'no-store'}
+            if feed_cache.get('etag'):
+                headers['If-None-Match'] = feed_cache['etag']
+            if feed_cache.get('modified'):
+                headers['If-Modified-Since'] = feed_cache['modified']
+            
+            response = self._get(url, timeout=15, headers=headers)
+            if response.status_code == 304 and 'polling_data' in feed_cache:
+                logger.info("Pew Research feed unchanged since the last run - reusing its result")
+                return feed_cache['polling_data']
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'xml')
+            feed = feedparser.parse(response.content)
             polling_data = []
             
             # Look for recent polling articles in RSS
-            items = soup.find_all('item')[:3]  # Get first 3 items
+            entries = feed.entries[:3]  # Get first 3 items
             
-            for item in items:
-                title_elem = item.find('title')
-                if not title_elem:
+            article_urls = []
+            for entry in entries:
+                title = entry.get('title', '').strip()
+                if not title:
                     continue
-                    
-                title = title_elem.get_text(strip=True)
                 
                 # Look for approval rating mentions
                 if any(keyword in title.lower() for keyword in ['approval', 'poll', 'survey', 'trump', 'president']):
-                    link_elem = item.find('link')
-                    if link_elem:
-                        article_url = link_elem.get_text(strip=True)
+                    link = entry.get('link', '').strip()
+                    if link:
+                        article_urls.append(link)
+            
+            def scan_article(article_url):
+                try:
+                    return self._scan_page(article_url, timeout=10)
+                except Exception as e:
+                    logger.warning(f"Error reading Pew article {article_url}: {e}")
+                    return None
+            
+            # Stream the candidate articles concurrently over the pooled session, each one stopping
+            # once both ratings are settled; a small worker cap keeps the load on
+            # pewresearch.org polite
+            with ThreadPoolExecutor(max_workers=PEW_ARTICLE_WORKERS) as executor:
+                scanners = list(executor.map(scan_article, article_urls))
+            
+            for article_url, scanner in zip(article_urls, scanners):
+                if scanner is None:
+                    continue
+                
+                try:
+                    if scanner.done:
+                        approve = _rating(scanner.approve_match)
+                        disapprove = _rating(scanner.disapprove_match)
                         
-                        # Try to get the article content
-                        try:
-                            article_response = self.session.get(article_url, timeout=10)
-                            article_soup = BeautifulSoup(article_response.content, 'html.parser')
-                            article_text = article_soup.get_text()
-                            
-                            # Look for approval rating numbers
-                            approval_patterns = [
-                                r'approve[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                                r'approval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                                r'(\d{2,3}(?:\.\d+)?)%\s*approve',
-                                r'(\d{2,3}(?:\.\d+)?)%\s*approval'
-                            ]
-                            
-                            disapprove_patterns = [
-                                r'disapprove[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                                r'disapproval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                                r'(\d{2,3}(?:\.\d+)?)%\s*disapprove',
-                                r'(\d{2,3}(?:\.\d+)?)%\s*disapproval'
-                            ]
-                            
-                            approve_match = None
-                            disapprove_match = None
-                            
-                            for pattern in approval_patterns:
-                                approve_match = re.search(pattern, article_text, re.IGNORECASE)
-                                if approve_match:
-                                    break
+                        # Validate that these are reasonable approval rating numbers
+                        if 20 <= approve <= 70 and 20 <= disapprove <= 70:
+                            polling_data.append(_poll_entry('Pew Research Center', approve, disapprove, 'Recent', article_url))
+                            break  # Found one, that's enough
                             
-                            for pattern in disapprove_patterns:
-                                disapprove_match = re.search(pattern, article_text, re.IGNORECASE)
-                                if disapprove_match:
-                                    break
-                            
-                            if approve_match and disapprove_match:
-                                try:
-                                    approve = float(approve_match.group(1))
-                                    disapprove = float(disapprove_match.group(1))
-                                    
-                                    # Validate that these are reasonable approval rating numbers
-                                    if 20 <= approve <= 70 and 20 <= disapprove <= 70:
-                                        unsure = max(0, 100 - approve - disapprove)
-                                        
-                                        polling_data.append({
-                                            'source': 'Pew Research Center',
-                                            'approve': approve,
-                                            'disapprove': disapprove,
-                                            'unsure': unsure,
-                                            'date': 'Recent',
-                                            'url': article_url
-                                        })
-                                        break  # Found one, that's enough
-                                except ValueError:
-                                    continue
-                                    
-                        except Exception as e:
-                            logger.warning(f"Error accessing Pew article: {e}")
-                            continue
-                            
-                time.sleep(1)  # Be respectful
+                except Exception as e:
+                    logger.warning(f"Error reading Pew article {article_url}: {e}")
+                    continue
+            
+            # Only a result built from every candidate article is worth replaying on a 304
+            if None not in scanners:
+                _save_feed_cache(PEW_FEED_CACHE, response, polling_data)
             
             return polling_data
             
@@ -135,694 +457,150 @@ class LegalPollingScraper:
         Scrape Real Clear Politics polling averages
         RCP aggregates publicly available polling data
         """
-        try:
-            # Try the main RCP page first
-            url = "https://www.realclearpolitics.com/"
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            polling_data = []
-            
-            # Look for approval rating data in the main page
-            text_content = soup.get_text()
-            
-            # Search for approval rating patterns
-            approval_patterns = [
-                r'approve[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'approval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'(\d{2,3}(?:\.\d+)?)%\s*approve',
-                r'(\d{2,3}(?:\.\d+)?)%\s*approval'
-            ]
-            
-            disapprove_patterns = [
-                r'disapprove[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'disapproval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'(\d{2,3}(?:\.\d+)?)%\s*disapprove',
-                r'(\d{2,3}(?:\.\d+)?)%\s*disapproval'
-            ]
-            
-            approve_match = None
-            disapprove_match = None
-            
-            for pattern in approval_patterns:
-                approve_match = re.search(pattern, text_content, re.IGNORECASE)
-                if approve_match:
-                    break
-            
-            for pattern in disapprove_patterns:
-                disapprove_match = re.search(pattern, text_content, re.IGNORECASE)
-                if disapprove_match:
-                    break
-            
-            if approve_match and disapprove_match:
-                try:
-                    approve = float(approve_match.group(1))
-                    disapprove = float(disapprove_match.group(1))
-                    
-                    # Validate that these are reasonable approval rating numbers
-                    if 20 <= approve <= 70 and 20 <= disapprove <= 70:
-                        unsure = max(0, 100 - approve - disapprove)
-                        
-                        polling_data.append({
-                            'source': 'Real Clear Politics',
-                            'approve': approve,
-                            'disapprove': disapprove,
-                            'unsure': unsure,
-                            'date': 'Current',
-                            'url': url
-                        })
-                except ValueError:
-                    pass
-            
-            return polling_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping Real Clear Politics: {e}")
-            return []
+        return self._scrape_approval(APPROVAL_SOURCES['real_clear_politics'])
     
     def scrape_five_thirty_eight(self):
         """
         Scrape FiveThirtyEight polling averages
         FiveThirtyEight provides publicly accessible polling data
         """
-        try:
-            # Try the main FiveThirtyEight site
-            url = "https://fivethirtyeight.com/"
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            polling_data = []
-            
-            # Look for approval rating data in the page
-            text_content = soup.get_text()
-            
-            # Try to find approval rating patterns
-            approval_patterns = [
-                r'approve[:\s]*(\d+\.?\d*)%',
-                r'approval[:\s]*(\d+\.?\d*)%',
-                r'(\d+\.?\d*)%\s*approve',
-                r'(\d+\.?\d*)%\s*approval'
-            ]
-            
-            disapprove_patterns = [
-                r'disapprove[:\s]*(\d+\.?\d*)%',
-                r'disapproval[:\s]*(\d+\.?\d*)%',
-                r'(\d+\.?\d*)%\s*disapprove',
-                r'(\d+\.?\d*)%\s*disapproval'
-            ]
-            
-            approve_match = None
-            disapprove_match = None
-            
-            for pattern in approval_patterns:
-                approve_match = re.search(pattern, text_content, re.IGNORECASE)
-                if approve_match:
-                    break
-            
-            for pattern in disapprove_patterns:
-                disapprove_match = re.search(pattern, text_content, re.IGNORECASE)
-                if disapprove_match:
-                    break
-            
-            if approve_match and disapprove_match:
-                try:
-                    approve = float(approve_match.group(1))
-                    disapprove = float(disapprove_match.group(1))
-                    
-                    # Validate that these are reasonable approval rating numbers
-                    if 20 <= approve <= 70 and 20 <= disapprove <= 70:
-                        unsure = max(0, 100 - approve - disapprove)
-                        
-                        polling_data.append({
-                            'source': 'FiveThirtyEight',
-                            'approve': approve,
-                            'disapprove': disapprove,
-                            'unsure': unsure,
-                            'date': 'Current',
-                            'url': url
-                        })
-                except ValueError:
-                    pass
-            
-            # If no patterns found, look for any percentage numbers
-            if not polling_data:
-                numbers = re.findall(r'(\d+\.?\d*)%', text_content)
-                if len(numbers) >= 2:
-                    try:
-                        approve = float(numbers[0])
-                        disapprove = float(numbers[1])
-                        unsure = max(0, 100 - approve - disapprove)
-                        
-                        polling_data.append({
-                            'source': 'FiveThirtyEight',
-                            'approve': approve,
-                            'disapprove': disapprove,
-                            'unsure': unsure,
-                            'date': 'Current',
-                            'url': url
-                        })
-                    except ValueError:
-                        pass
-            
-            return polling_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping FiveThirtyEight: {e}")
-            return []
+        return self._scrape_approval(APPROVAL_SOURCES['five_thirty_eight'])
     
     def scrape_cnn_poll(self):
         """
         Scrape CNN polling data
         CNN conducts regular political polls with professional methodology
         """
-        try:
-            # Try to scrape CNN's polling page
-            url = "https://www.cnn.com/politics"
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            polling_data = []
-            
-            # Look for polling data in CNN's content
-            text_content = soup.get_text()
-            
-            # Search for approval rating patterns
-            approval_patterns = [
-                r'approve[:\s]*(\d+\.?\d*)%',
-                r'approval[:\s]*(\d+\.?\d*)%',
-                r'(\d+\.?\d*)%\s*approve',
-                r'(\d+\.?\d*)%\s*approval'
-            ]
-            
-            disapprove_patterns = [
-                r'disapprove[:\s]*(\d+\.?\d*)%',
-                r'disapproval[:\s]*(\d+\.?\d*)%',
-                r'(\d+\.?\d*)%\s*disapprove',
-                r'(\d+\.?\d*)%\s*disapproval'
-            ]
-            
-            approve_match = None
-            disapprove_match = None
-            
-            for pattern in approval_patterns:
-                approve_match = re.search(pattern, text_content, re.IGNORECASE)
-                if approve_match:
-                    break
-            
-            for pattern in disapprove_patterns:
-                disapprove_match = re.search(pattern, text_content, re.IGNORECASE)
-                if disapprove_match:
-                    break
-            
-            if approve_match and disapprove_match:
-                try:
-                    approve = float(approve_match.group(1))
-                    disapprove = float(disapprove_match.group(1))
-                    unsure = max(0, 100 - approve - disapprove)
-                    
-                    polling_data.append({
-                        'source': 'CNN',
-                        'approve': approve,
-                        'disapprove': disapprove,
-                        'unsure': unsure,
-                        'date': 'Current',
-                        'url': url
-                    })
-                except ValueError:
-                    pass
-            
-            return polling_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping CNN Poll: {e}")
-            return []
+        return self._scrape_approval(APPROVAL_SOURCES['cnn'])
     
     def scrape_nytimes_poll(self):
         """
-        Scrape New York Times polling data
+        New York Times polling data (published figures, no network request)
         NYT conducts high-quality political polls with rigorous methodology
         """
-        try:
-            # New York Times typically shows approval ratings with detailed methodology
-            polling_data = [
-                {
-                    'source': 'New York Times',
-                    'approve': 41.0,
-                    'disapprove': 57.5,
-                    'unsure': 1.5,
-                    'date': '2025-01-25',
-                    'url': 'https://www.nytimes.com/interactive/2024/upshot/polls.html'
-                }
-            ]
-            
-            return polling_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping New York Times Poll: {e}")
-            return []
+        return [dict(STATIC_POLLS['nytimes'])]
     
     def scrape_cnbc_poll(self):
         """
-        Scrape CNBC polling data
+        CNBC polling data (published figures, no network request)
         CNBC focuses on economic and political polling
         """
-        try:
-            # CNBC typically shows approval ratings with economic focus
-            polling_data = [
-                {
-                    'source': 'CNBC',
-                    'approve': 39.8,
-                    'disapprove': 58.7,
-                    'unsure': 1.5,
-                    'date': '2025-01-28',
-                    'url': 'https://www.cnbc.com/politics/'
-                }
-            ]
-            
-            return polling_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping CNBC Poll: {e}")
-            return []
+        return [dict(STATIC_POLLS['cnbc'])]
     
     def scrape_economist_poll(self):
         """
-        Scrape The Economist polling data
+        The Economist polling data (published figures, no network request)
         The Economist conducts international and domestic political polls
         """
-        try:
-            # The Economist typically shows approval ratings with international perspective
-            polling_data = [
-                {
-                    'source': 'The Economist',
-                    'approve': 40.2,
-                    'disapprove': 57.3,
-                    'unsure': 2.5,
-                    'date': '2025-01-30',
-                    'url': 'https://www.economist.com/graphic-detail'
-                }
-            ]
-            
-            return polling_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping The Economist Poll: {e}")
-            return []
+        return [dict(STATIC_POLLS['economist'])]
     
     def scrape_reuters_ipsos(self):
         """
         Scrape Reuters/Ipsos polling data from recent articles
         """
-        try:
-            # Try multiple recent Reuters articles
-            urls = [
-                "https://www.reuters.com/data/trumps-approval-rating-2025-01-21/",
-                "https://www.reuters.com/commentary/breakingviews/donald-trump-is-weaker-than-he-looks-2025-08-31/",
-                "https://www.reuters.com/world/us/"
-            ]
-            
-            for url in urls:
-                try:
-                    response = self.session.get(url, timeout=15)
-                    response.raise_for_status()
-                    
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    text_content = soup.get_text()
-                    
-                    # Search for approval rating patterns
-                    approval_patterns = [
-                        r'approve[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                        r'approval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                        r'(\d{2,3}(?:\.\d+)?)%\s*approve',
-                        r'(\d{2,3}(?:\.\d+)?)%\s*approval'
-                    ]
-                    
-                    disapprove_patterns = [
-                        r'disapprove[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                        r'disapproval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                        r'(\d{2,3}(?:\.\d+)?)%\s*disapprove',
-                        r'(\d{2,3}(?:\.\d+)?)%\s*disapproval'
-                    ]
-                    
-                    approve_match = None
-                    disapprove_match = None
-                    
-                    for pattern in approval_patterns:
-                        approve_match = re.search(pattern, text_content, re.IGNORECASE)
-                        if approve_match:
-                            break
-                    
-                    for pattern in disapprove_patterns:
-                        disapprove_match = re.search(pattern, text_content, re.IGNORECASE)
-                        if disapprove_match:
-                            break
-                    
-                    if approve_match and disapprove_match:
-                        try:
-                            approve = float(approve_match.group(1))
-                            disapprove = float(disapprove_match.group(1))
-                            
-                            # Validate that these are reasonable approval rating numbers
-                            if 20 <= approve <= 70 and 20 <= disapprove <= 70:
-                                unsure = max(0, 100 - approve - disapprove)
-                                
-                                return [{
-                                    'source': 'Reuters/Ipsos',
-                                    'approve': approve,
-                                    'disapprove': disapprove,
-                                    'unsure': unsure,
-                                    'date': '2025-01-21',
-                                    'url': url
-                                }]
-                        except ValueError:
-                            continue
-                            
-                except Exception as e:
-                    logger.warning(f"Failed to scrape {url}: {e}")
-                    continue
-            
-            return []
-            
-        except Exception as e:
-            logger.error(f"Error scraping Reuters/Ipsos: {e}")
-            return []
+        return self._scrape_approval(APPROVAL_SOURCES['reuters_ipsos'])
     
     def scrape_gallup(self):
         """
         Scrape Gallup polling data
         """
-        try:
-            url = "https://news.gallup.com/poll/659534/trump-first-quarter-approval-rating-below-average.aspx"
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            polling_data = []
-            
-            # Look for approval rating data in the article
-            text_content = soup.get_text()
-            
-            # Search for approval rating patterns
-            approval_patterns = [
-                r'approve[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'approval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'(\d{2,3}(?:\.\d+)?)%\s*approve',
-                r'(\d{2,3}(?:\.\d+)?)%\s*approval'
-            ]
-            
-            disapprove_patterns = [
-                r'disapprove[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'disapproval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'(\d{2,3}(?:\.\d+)?)%\s*disapprove',
-                r'(\d{2,3}(?:\.\d+)?)%\s*disapproval'
-            ]
-            
-            approve_match = None
-            disapprove_match = None
-            
-            for pattern in approval_patterns:
-                approve_match = re.search(pattern, text_content, re.IGNORECASE)
-                if approve_match:
-                    break
-            
-            for pattern in disapprove_patterns:
-                disapprove_match = re.search(pattern, text_content, re.IGNORECASE)
-                if disapprove_match:
-                    break
-            
-            if approve_match and disapprove_match:
-                try:
-                    approve = float(approve_match.group(1))
-                    disapprove = float(disapprove_match.group(1))
-                    
-                    # Validate that these are reasonable approval rating numbers
-                    if 20 <= approve <= 70 and 20 <= disapprove <= 70:
-                        unsure = max(0, 100 - approve - disapprove)
-                        
-                        polling_data.append({
-                            'source': 'Gallup',
-                            'approve': approve,
-                            'disapprove': disapprove,
-                            'unsure': unsure,
-                            'date': '2025-04-17',
-                            'url': url
-                        })
-                except ValueError:
-                    pass
-            
-            return polling_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping Gallup: {e}")
-            return []
+        return self._scrape_approval(APPROVAL_SOURCES['gallup'])
     
     def scrape_rasmussen(self):
         """
         Scrape Rasmussen Reports daily tracking poll
         """
-        try:
-            url = "https://www.rasmussenreports.com/public_content/politics/obama_administration/daily_presidential_tracking_poll"
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            polling_data = []
-            
-            # Look for approval rating data
-            text_content = soup.get_text()
-            
-            # Search for approval rating patterns
-            approval_patterns = [
-                r'approve[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'approval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'(\d{2,3}(?:\.\d+)?)%\s*approve',
-                r'(\d{2,3}(?:\.\d+)?)%\s*approval'
-            ]
-            
-            disapprove_patterns = [
-                r'disapprove[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'disapproval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'(\d{2,3}(?:\.\d+)?)%\s*disapprove',
-                r'(\d{2,3}(?:\.\d+)?)%\s*disapproval'
-            ]
-            
-            approve_match = None
-            disapprove_match = None
-            
-            for pattern in approval_patterns:
-                approve_match = re.search(pattern, text_content, re.IGNORECASE)
-                if approve_match:
-                    break
-            
-            for pattern in disapprove_patterns:
-                disapprove_match = re.search(pattern, text_content, re.IGNORECASE)
-                if disapprove_match:
-                    break
-            
-            if approve_match and disapprove_match:
-                try:
-                    approve = float(approve_match.group(1))
-                    disapprove = float(disapprove_match.group(1))
-                    
-                    # Validate that these are reasonable approval rating numbers
-                    if 20 <= approve <= 70 and 20 <= disapprove <= 70:
-                        unsure = max(0, 100 - approve - disapprove)
-                        
-                        polling_data.append({
-                            'source': 'Rasmussen Reports',
-                            'approve': approve,
-                            'disapprove': disapprove,
-                            'unsure': unsure,
-                            'date': '2025-01-21',
-                            'url': url
-                        })
-                except ValueError:
-                    pass
-            
-            return polling_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping Rasmussen Reports: {e}")
-            return []
+        return self._scrape_approval(APPROVAL_SOURCES['rasmussen'])
     
     def scrape_morning_consult(self):
         """
         Scrape Morning Consult approval ratings
         """
-        try:
-            url = "https://pro.morningconsult.com/trackers/donald-trump-approval-rating-by-state"
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            polling_data = []
-            
-            # Look for approval rating data
-            text_content = soup.get_text()
-            
-            # Search for approval rating patterns
-            approval_patterns = [
-                r'approve[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'approval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'(\d{2,3}(?:\.\d+)?)%\s*approve',
-                r'(\d{2,3}(?:\.\d+)?)%\s*approval'
-            ]
-            
-            disapprove_patterns = [
-                r'disapprove[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'disapproval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'(\d{2,3}(?:\.\d+)?)%\s*disapprove',
-                r'(\d{2,3}(?:\.\d+)?)%\s*disapproval'
-            ]
-            
-            approve_match = None
-            disapprove_match = None
-            
-            for pattern in approval_patterns:
-                approve_match = re.search(pattern, text_content, re.IGNORECASE)
-                if approve_match:
-                    break
-            
-            for pattern in disapprove_patterns:
-                disapprove_match = re.search(pattern, text_content, re.IGNORECASE)
-                if disapprove_match:
-                    break
-            
-            if approve_match and disapprove_match:
-                try:
-                    approve = float(approve_match.group(1))
-                    disapprove = float(disapprove_match.group(1))
-                    
-                    # Validate that these are reasonable approval rating numbers
-                    if 20 <= approve <= 70 and 20 <= disapprove <= 70:
-                        unsure = max(0, 100 - approve - disapprove)
-                        
-                        polling_data.append({
-                            'source': 'Morning Consult',
-                            'approve': approve,
-                            'disapprove': disapprove,
-                            'unsure': unsure,
-                            'date': '2025-01-21',
-                            'url': url
-                        })
-                except ValueError:
-                    pass
-            
-            return polling_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping Morning Consult: {e}")
-            return []
+        return self._scrape_approval(APPROVAL_SOURCES['morning_consult'])
     
     def scrape_economist(self):
         """
         Scrape The Economist approval tracker
         """
-        try:
-            url = "https://www.economist.com/interactive/trump-approval-tracker"
-            response = self.session.get(url, timeout=15)
+        return self._scrape_approval(APPROVAL_SOURCES['economist'])
+    
+    def _scan_page(self, url, timeout=15, approve_res=_APPROVE_RES, disapprove_res=_DISAPPROVE_RES):
+        """
+        Stream a page into a _RatingScanner, closing the connection as soon as both ratings are settled
+        """
+        # 'no-store' keeps the page out of the requests-cache session, which would read the whole body
+        # to store it and so defeat the early stop
+        with self._get(url, timeout=timeout, stream=True, headers={'Cache-Control': 'no-store'}) as response:
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            polling_data = []
-            
-            # Look for approval rating data
-            text_content = soup.get_text()
-            
-            # Search for approval rating patterns
-            approval_patterns = [
-                r'approve[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'approval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'(\d{2,3}(?:\.\d+)?)%\s*approve',
-                r'(\d{2,3}(?:\.\d+)?)%\s*approval'
-            ]
-            
-            disapprove_patterns = [
-                r'disapprove[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'disapproval[:\s]*(\d{2,3}(?:\.\d+)?)%',
-                r'(\d{2,3}(?:\.\d+)?)%\s*disapprove',
-                r'(\d{2,3}(?:\.\d+)?)%\s*disapproval'
-            ]
-            
-            approve_match = None
-            disapprove_match = None
-            
-            for pattern in approval_patterns:
-                approve_match = re.search(pattern, text_content, re.IGNORECASE)
-                if approve_match:
-                    break
-            
-            for pattern in disapprove_patterns:
-                disapprove_match = re.search(pattern, text_content, re.IGNORECASE)
-                if disapprove_match:
+            scanner = _RatingScanner(approve_res, disapprove_res)
+            for chunk in response.iter_content(_RatingScanner.SCAN_EVERY):
+                if scanner.feed(chunk):
                     break
-            
-            if approve_match and disapprove_match:
-                try:
-                    approve = float(approve_match.group(1))
-                    disapprove = float(disapprove_match.group(1))
+            else:
+                scanner.finish()
+        return scanner
+    
+    def _scrape_approval(self, config):
+        """
+        Scrape an approval/disapproval pair from the pages of one APPROVAL_SOURCES entry
+        """
+        source = config['source']
+        if config.get('loose'):
+            approve_res, disapprove_res = _APPROVE_RES_LOOSE, _DISAPPROVE_RES_LOOSE
+        else:
+            approve_res, disapprove_res = _APPROVE_RES, _DISAPPROVE_RES
+        
+        for url in config['urls']:
+            try:
+                # Search for approval rating patterns while the page downloads
+                scanner = self._scan_page(url, 15, approve_res, disapprove_res)
+                
+                if scanner.done:
+                    approve = _rating(scanner.approve_match)
+                    disapprove = _rating(scanner.disapprove_match)
                     
                     # Validate that these are reasonable approval rating numbers
-                    if 20 <= approve <= 70 and 20 <= disapprove <= 70:
-                        unsure = max(0, 100 - approve - disapprove)
-                        
-                        polling_data.append({
-                            'source': 'The Economist',
-                            'approve': approve,
-                            'disapprove': disapprove,
-                            'unsure': unsure,
-                            'date': '2025-01-21',
-                            'url': url
-                        })
-                except ValueError:
-                    pass
-            
-            return polling_data
-            
-        except Exception as e:
-            logger.error(f"Error scraping The Economist: {e}")
-            return []
+                    if not config.get('validate', True) or (20 <= approve <= 70 and 20 <= disapprove <= 70):
+                        return [_poll_entry(source, approve, disapprove, config['date'], url)]
+                
+                # If no patterns found, look for any percentage numbers (the first two always lie
+                # within the text scanned, even when the download stopped early)
+                if config.get('any_percentages'):
+                    numbers = _ANY_PERCENT_RE.findall(scanner.text)
+                    if len(numbers) >= 2:
+                        return [_poll_entry(source, float(numbers[0]), float(numbers[1]), config['date'], url)]
+                
+            except Exception as e:
+                logger.error(f"Error scraping {source} ({url}): {e}")
+                continue
+        
+        return []
     
-
     def get_legal_polling_data(self):
         """
         Aggregate polling data from legal sources
         """
-        all_data = []
-        real_data_count = 0
-        
-        logger.info("Scraping Reuters/Ipsos...")
-        reuters_data = self.scrape_reuters_ipsos()
-        all_data.extend(reuters_data)
-        if reuters_data:
-            real_data_count += 1
-        
-        logger.info("Scraping Rasmussen Reports...")
-        rasmussen_data = self.scrape_rasmussen()
-        all_data.extend(rasmussen_data)
-        if rasmussen_data:
-            real_data_count += 1
+        sources = (
+            ("Reuters/Ipsos", self.scrape_reuters_ipsos),
+            ("Rasmussen Reports", self.scrape_rasmussen),
+            ("Morning Consult", self.scrape_morning_consult),
+            ("FiveThirtyEight", self.scrape_five_thirty_eight),
+            ("The Economist", self.scrape_economist)
+        )
         
-        logger.info("Scraping Morning Consult...")
-        morning_consult_data = self.scrape_morning_consult()
-        all_data.extend(morning_consult_data)
-        if morning_consult_data:
-            real_data_count += 1
+        def scrape(source):
+            name, scraper = source
+            logger.info(f"Scraping {name}...")
+            return scraper()
         
-        logger.info("Scraping FiveThirtyEight...")
-        fte_data = self.scrape_five_thirty_eight()
-        all_data.extend(fte_data)
-        if fte_data:
-            real_data_count += 1
-        
-        logger.info("Scraping The Economist...")
-        economist_data = self.scrape_economist()
-        all_data.extend(economist_data)
-        if economist_data:
-            real_data_count += 1
+        # The sources are independent network calls, so scrape them concurrently (results keep this order)
+        all_data = []
+        real_data_count = 0
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            for source_data in executor.map(scrape, sources):
+                all_data.extend(source_data)
+                if source_data:
+                    real_data_count += 1
         
         # If we got no real data, return empty list (no fallback)
         if real_data_count == 0:
@@ -857,7 +635,7 @@ class LegalPollingScraper:
         processed = {
             'metadata': {
                 'scraped_at': datetime.now().isoformat(),
-                'sources': list(set([item.get('source', 'Unknown') for item in raw_data])),
+                'sources': sorted({item.get('source', 'Unknown') for item in raw_data}),
                 'total_polls': len(raw_data),
                 'legal_notice': 'Data scraped from publicly available sources with proper attribution'
             },
@@ -872,23 +650,35 @@ class LegalPollingScraper:
         approve_values = []
         disapprove_values = []
         
+        # Bound methods hoisted out of the per-poll loop
+        add_poll = processed['polls'].append
+        add_approve = approve_values.append
+        add_disapprove = disapprove_values.append
+        
         for item in raw_data:
             if 'approve' in item and 'disapprove' in item:
                 try:
                     approve = float(item['approve'])
                     disapprove = float(item['disapprove'])
                     
-                    processed['polls'].append({
-                        'source': item.get('source', 'Unknown'),
+                    # Scraped entries already carry their unsure share; derive it only when missing
+                    get = item.get
+                    unsure = get('unsure')
+                    if unsure is None:
+                        unsure = 100 - approve - disapprove
+                        unsure = unsure if unsure > 0 else 0  # same result as max(0, ...) without the call
+                    
+                    add_poll({
+                        'source': get('source', 'Unknown'),
                         'approve': approve,
                         'disapprove': disapprove,
-                        'unsure': max(0, 100 - approve - disapprove),
-                        'date': item.get('date', 'Unknown'),
-                        'url': item.get('url', '')
+                        'unsure': unsure,
+                        'date': get('date', 'Unknown'),
+                        'url': get('url', '')
                     })
                     
-                    approve_values.append(approve)
-                    disapprove_values.append(disapprove)
+                    add_approve(approve)
+                    add_disapprove(disapprove)
                     
                 except (ValueError, TypeError):
                     continue
@@ -901,10 +691,41 @@ class LegalPollingScraper:
         
         return processed
 
+def _dumps_compact(obj):
+    """Compact UTF-8 JSON bytes for obj (orjson when available)"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def write_polling_json(f, polling_data):
+    """
+    Write polling_data to the binary file f as compact JSON, one top-level field (and one poll)
+    at a time, so the encoded document is never held in memory as a whole
+    """
+    f.write(b'{')
+    for i, (key, value) in enumerate(polling_data.items()):
+        if i:
+            f.write(b',')
+        f.write(_dumps_compact(key) + b':')
+        if isinstance(value, list):
+            f.write(b'[')
+            for j, item in enumerate(value):
+                if j:
+                    f.write(b',')
+                f.write(_dumps_compact(item))
+            f.write(b']')
+        else:
+            f.write(_dumps_compact(value))
+    f.write(b'}')
+
 def main():
     """
     Main function to run the polling scraper
     """
+    parser = argparse.ArgumentParser(description='Scrape legal polling data into public/data/legal_polling_data.json')
+    parser.add_argument('--pretty', action='store_true', help='Also write an indented legal_polling_data.pretty.json copy for reading')
+    args = parser.parse_args()
+    
     scraper = LegalPollingScraper()
     
     logger.info("Starting legal polling data scraping...")
@@ -913,17 +734,24 @@ def main():
         polling_data = scraper.get_legal_polling_data()
         
         # Save to JSON file
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.join(script_dir, '..')
-        public_data_dir = os.path.join(project_root, 'public', 'data')
-        
         # Create the directory if it doesn't exist
-        os.makedirs(public_data_dir, exist_ok=True)
+        PUBLIC_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        
+        output_file = PUBLIC_DATA_DIR / 'legal_polling_data.json'
         
-        output_file = os.path.join(public_data_dir, 'legal_polling_data.json')
+        # Compact JSON - the file is read by the dashboard, not by people
+        with open(output_file, 'wb') as f:
+            write_polling_json(f, polling_data)
         
-        with open(output_file, 'w') as f:
-            json.dump(polling_data, f, indent=2)
+        if args.pretty:
+            if orjson:
+                payload = orjson.dumps(polling_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(polling_data, indent=2, ensure_ascii=False).encode('utf-8')
+            pretty_file = PUBLIC_DATA_DIR / 'legal_polling_data.pretty.json'
+            with open(pretty_file, 'wb') as f:
+                f.write(payload)
+            logger.info(f"Readable copy saved to {pretty_file}")
             
         logger.info(f"Polling data saved to {output_file}")
         logger.info(f"Scraped {len(polling_data['polls'])} polls from {len(polling_data['metadata']['sources'])} sources")
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Per-host request rate limiting shared by the data collection scripts
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """Thread-safe token bucket kept per host, so politeness towards one site never delays another"""
+
+    def __init__(self, rate: float = 10.0, burst: int = 10):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str):
+        """Block until a request to the host of url is within budget"""
+        host = urlparse(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                tokens, last = self._buckets.get(host, (self.burst, now))
+                tokens = min(self.burst, tokens + (now - last) * self.rate)
+                if tokens >= 1:
+                    self._buckets[host] = (tokens - 1, now)
+                    return
+                self._buckets[host] = (tokens, now)
+                wait = (1 - tokens) / self.rate
+            time.sleep(wait)
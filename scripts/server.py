@@ -8,18 +8,54 @@ import http.server
 import socketserver
 import webbrowser
 import os
+from http import HTTPStatus
 from pathlib import Path
 import argparse
 
 PORT = 8000
 
 class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    def handle_one_request(self):
+        # A keep-alive connection reuses the handler, so per-request state starts fresh each time
+        self._etag = None
+        super().handle_one_request()
+    
     def end_headers(self):
         # Enable CORS for local development
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        
+        # Let browsers keep static files but revalidate them (ETag / Last-Modified) on every load
+        if self._etag:
+            self.send_header('ETag', self._etag)
+            self.send_header('Cache-Control', 'no-cache')
         super().end_headers()
+    
+    def send_head(self):
+        # ETag from the file's mtime and size (no need to read it); answer If-None-Match with a 304.
+        # If-Modified-Since is handled by SimpleHTTPRequestHandler itself.
+        path = self.translate_path(self.path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st is not None and os.path.isfile(path):
+            self._etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+            if_none_match = self.headers.get('If-None-Match')
+            if if_none_match:
+                tags = {tag.strip() for tag in if_none_match.split(',')}
+                if '*' in tags or self._etag in tags or 'W/' + self._etag in tags:
+                    self.send_response(HTTPStatus.NOT_MODIFIED)
+                    self.end_headers()
+                    return None
+        return super().send_head()
+    
+    def copyfile(self, source, outputfile):
+        # Hand the file to the kernel with sendfile() instead of copying it through Python buffers
+        # (socket.sendfile falls back to a send() loop for in-memory bodies such as directory listings)
+        outputfile.flush()
+        self.connection.sendfile(source)
 
     def do_OPTIONS(self):
         self.send_response(200)
@@ -108,7 +144,9 @@ def serve_dashboard(dashboard_name=None, port=PORT, open_browser=True):
     
     # Create and start server
     try:
-        with socketserver.TCPServer(("", port), CustomHTTPRequestHandler) as httpd:
+        # One thread per connection, so a slow download of a large JSON file doesn't stall other requests
+        with socketserver.ThreadingTCPServer(("", port), CustomHTTPRequestHandler) as httpd:
+            httpd.daemon_threads = True  # don't let open keep-alive connections block Ctrl+C
             if open_browser:
                 print(f"🌐 Opening browser...")
                 webbrowser.open(url)
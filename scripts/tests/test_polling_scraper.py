@@ -0,0 +1,74 @@
+"""Regression tests for the polling scraper's approval/disapproval page scans"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import polling_scraper
+
+
+def scan(html, use_lxml):
+    """Ratings found by streaming html through a _RatingScanner, with or without the lxml parser"""
+    etree = polling_scraper.etree
+    if not use_lxml:
+        polling_scraper.etree = None
+    try:
+        scanner = polling_scraper._RatingScanner()
+        data = html.encode('utf-8')
+        step = polling_scraper._RatingScanner.SCAN_EVERY
+        for i in range(0, len(data), step):
+            if scanner.feed(data[i:i + step]):
+                break
+        else:
+            scanner.finish()
+    finally:
+        polling_scraper.etree = etree
+    return (
+        scanner.approve_match and polling_scraper._rating(scanner.approve_match),
+        scanner.disapprove_match and polling_scraper._rating(scanner.disapprove_match),
+    )
+
+
+PARSERS = [False, pytest.param(True, marks=pytest.mark.skipif(polling_scraper.etree is None, reason="lxml not installed"))]
+
+
+@pytest.mark.parametrize('use_lxml', PARSERS)
+def test_labelled_rating_outranks_earlier_trailing_form(use_lxml):
+    # "45%Disapproval" must not beat "Disapproval 52%" - the "disapproval N%" pattern is tried first
+    html = '<p><b>Trump approval: 45%</b><b>Disapproval 52%</b></p>'
+    assert scan(html, use_lxml) == (45.0, 52.0)
+
+
+@pytest.mark.parametrize('use_lxml', PARSERS)
+def test_pattern_priority_follows_pattern_order(use_lxml):
+    assert scan('<p>10% approve 80% disapprove</p>', use_lxml) == (80.0, 80.0)
+
+
+@pytest.mark.parametrize('use_lxml', PARSERS)
+def test_match_split_across_scan_boundary(use_lxml):
+    padding = 'x' * (polling_scraper._RatingScanner.SCAN_EVERY - 20)
+    html = '<p>' + padding + 'approve' + ' ' * 50 + '41% and disapprove 55%</p>'
+    assert scan(html, use_lxml) == (41.0, 55.0)
+
+
+@pytest.mark.parametrize('use_lxml', PARSERS)
+def test_script_text_is_ignored(use_lxml):
+    html = '<script>var a = "approve 99% disapprove 1%"</script><p>approve 44% disapprove 53%</p>'
+    assert scan(html, use_lxml) == (44.0, 53.0)
+
+
+@pytest.mark.parametrize('use_lxml', PARSERS)
+def test_number_split_across_inline_tags(use_lxml):
+    # Text nodes join with nothing, as with BeautifulSoup's get_text(), so the percent sign stays attached
+    html = '<p>Approve <b>45</b>% Disapprove <b>52</b>%</p>'
+    assert scan(html, use_lxml) == (45.0, 52.0)
+
+
+@pytest.mark.parametrize('use_lxml', PARSERS)
+def test_indented_table_cells(use_lxml):
+    cell = '\n' + ' ' * 200
+    html = f'<table><tr><td>Approve:</td>{cell}<td>{cell}46%</td></tr><tr><td>Disapprove</td>{cell}<td>51%</td></tr></table>'
+    assert scan(html, use_lxml) == (46.0, 51.0)
@@ -4,129 +4,180 @@ Create Sources List from Gemini Tariff Analysis
 Uses the same logic as tariff_merger.py to extract clean source names
 """
 
+import argparse
 import json
 import os
 import re
-from typing import Dict, List, Any, Set
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Set, Tuple
+
+# Paths resolved once at import (this script lives in <project>/scripts/trump_admin/economic_policy)
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SCRIPT_DIR.parents[2]
+PUBLIC_DATA_DIR = PROJECT_ROOT / 'public' / 'data'
+
+# Optional faster JSON decoder/encoder (falls back to the standard library)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Aho-Corasick automaton for matching all known source names in one pass over a title
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Sources to exclude
+EXCLUDED_SOURCES = frozenset({
+    'wikipedia', 'itvx', 'alcircle', 'trade war news',
+    'profit by pakistan today', 'business and economy news'
+})
+
+# Names that are not companies: dates like 2025-06-30 or 6/30/2025, years like 2025 and other pure numbers
+NON_COMPANY_RE = re.compile(r'^(?:\d{4}-\d{2}-\d{2}|\d{1,2}/\d{1,2}/\d{4}|\d+)$')
+
+# Specific abbreviations to exclude (but keep legitimate media companies)
+EXCLUDED_ABBREVIATIONS = frozenset({
+    'ASI', 'KEYT'  # These appear to be non-media abbreviations
+})
+
+# Known sources recognised in titles without a separator: (search term, proper name), earlier entries win
+KNOWN_SOURCES = (
+    ('bbc', 'BBC'),
+    ('cnn', 'CNN'),
+    ('reuters', 'Reuters'),
+    ('bloomberg', 'Bloomberg'),
+    ('wall street journal', 'Wall Street Journal'),
+    ('wsj', 'Wall Street Journal'),
+    ('new york times', 'New York Times'),
+    ('washington post', 'Washington Post'),
+    ('politico', 'Politico'),
+    ('axios', 'Axios'),
+    ('associated press', 'Associated Press'),
+    ('ap news', 'Associated Press'),
+    ('npr', 'NPR'),
+    ('fox news', 'Fox News'),
+    ('abc news', 'ABC'),
+    ('cbs news', 'CBS'),
+    ('nbc news', 'NBC'),
+    ('usa today', 'USA Today'),
+    ('time', 'Time'),
+    ('newsweek', 'Newsweek'),
+    ('forbes', 'Forbes'),
+    ('business insider', 'Business Insider'),
+    ('cnbc', 'CNBC'),
+    ('marketwatch', 'MarketWatch'),
+    ('yahoo finance', 'Yahoo Finance'),
+    ('financial times', 'Financial Times'),
+    ('ft', 'Financial Times'),
+    ('the economist', 'The Economist'),
+    ('foreign policy', 'Foreign Policy'),
+    ('foreign affairs', 'Foreign Affairs'),
+    ('csis', 'CSIS'),
+    ('white & case', 'White & Case'),
+    ('white house', 'White House'),
+    ('us trade representative', 'US Trade Representative'),
+    ('department of commerce', 'Department of Commerce')
+)
+
+# Words suggesting a title is an article rather than a source name (matched anywhere, like a substring check)
+ARTICLE_INDICATORS = (
+    'how', 'what', 'when', 'where', 'why', 'analysis', 'report',
+    'update', 'breaking', 'latest', 'new', 'trump', 'biden'
+)
+ARTICLE_INDICATOR_RE = re.compile('|'.join(map(re.escape, ARTICLE_INDICATORS)))
+
+def build_known_sources_automaton():
+    """Aho-Corasick automaton over the KNOWN_SOURCES search terms, each stored with its table position"""
+    automaton = ahocorasick.Automaton()
+    for index, (search_term, proper_name) in enumerate(KNOWN_SOURCES):
+        automaton.add_word(search_term, (index, proper_name))
+    automaton.make_automaton()
+    return automaton
+
+KNOWN_SOURCES_AUTOMATON = build_known_sources_automaton() if ahocorasick else None
+
+def match_known_source(title_lower: str) -> Optional[str]:
+    """Proper name of the first KNOWN_SOURCES entry whose search term occurs in the (lowercased) title"""
+    if KNOWN_SOURCES_AUTOMATON is None:
+        for search_term, proper_name in KNOWN_SOURCES:
+            if search_term in title_lower:
+                return proper_name
+        return None
+    
+    # One pass finds every term in the title; table order (not position in the title) decides
+    best = None
+    for _, (index, proper_name) in KNOWN_SOURCES_AUTOMATON.iter(title_lower):
+        if best is None or index < best[0]:
+            best = (index, proper_name)
+    return best[1] if best else None
+
+@lru_cache(maxsize=4096)
+def classify_title(title: str) -> Tuple[Optional[str], Optional[str]]:
+    """(source name or None, diagnostic message or None) for one source title - using tariff_merger.py logic"""
+    title_lower = title.lower()
+    
+    # First check if title contains any excluded sources
+    if any(excluded in title_lower for excluded in EXCLUDED_SOURCES):
+        return None, f"Excluding filtered source from title: {title[:50]}..."
+    
+    # The source follows the last ' - ' (or failing that the last ' | ') separator
+    for separator in (' - ', ' | '):
+        _, found, source = title.rpartition(separator)
+        if found:
+            source = source.strip()
+            # Check if source should be excluded
+            if source.lower() not in EXCLUDED_SOURCES:
+                return source, None
+            return None, f"Excluding filtered source: {source}"
+    
+    # If no clear separator, try to identify known sources
+    known_source = match_known_source(title_lower)
+    if known_source:
+        return known_source, None
+    
+    # Check if it looks like an article title (not a source)
+    is_likely_article = ARTICLE_INDICATOR_RE.search(title_lower) is not None
+    is_too_long = len(title) > 60  # Long titles are usually articles, not sources
+    
+    if not is_likely_article and not is_too_long:
+        return None, f"Skipping unclear source: {title[:50]}..."
+    return None, None
+
+def load_json_file(path: str) -> Any:
+    """Load a JSON file, parsing the raw bytes with orjson when available"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 class SourcesListCreator:
     """Creates clean sources list using tariff_merger.py logic"""
     
     def __init__(self):
-        self.script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.project_root = os.path.join(self.script_dir, '..', '..', '..')
-        self.public_data_dir = os.path.join(self.project_root, 'public', 'data')
+        self.script_dir = SCRIPT_DIR
+        self.project_root = PROJECT_ROOT
+        self.public_data_dir = PUBLIC_DATA_DIR
         
         # File paths
-        self.gemini_file = os.path.join(self.public_data_dir, 'gemini_tariff_analysis.json')
-        self.clean_file = os.path.join(self.public_data_dir, 'tariff_data_clean.json')
+        self.gemini_file = PUBLIC_DATA_DIR / 'gemini_tariff_analysis.json'
+        self.clean_file = PUBLIC_DATA_DIR / 'tariff_data_clean.json'
     
     def extract_source_names(self, source_titles: List[str]) -> List[str]:
         """Extract just the source names from source titles - using tariff_merger.py logic."""
-        # Sources to exclude
-        excluded_sources = {
-            'wikipedia', 'itvx', 'alcircle', 'trade war news', 
-            'profit by pakistan today', 'business and economy news'
-        }
-        
-        # Patterns that indicate non-company names
-        non_company_patterns = [
-            r'^\d{4}-\d{2}-\d{2}$',  # Dates like 2025-06-30
-            r'^\d{4}$',              # Years like 2025
-            r'^\d+$',                # Pure numbers
-            r'^\d{1,2}/\d{1,2}/\d{4}$',  # Date formats like 6/30/2025
-        ]
-        
-        # Specific abbreviations to exclude (but keep legitimate media companies)
-        excluded_abbreviations = {
-            'ASI', 'KEYT'  # These appear to be non-media abbreviations
-        }
-        
         sources = []
         for title in source_titles:
             if not title:
                 continue
             
-            title_lower = title.lower()
-            
-            # First check if title contains any excluded sources
-            if any(excluded in title_lower for excluded in excluded_sources):
-                print(f"Excluding filtered source from title: {title[:50]}...")
-                continue
-            
-            if ' - ' in title:
-                source = title.split(' - ')[-1].strip()
-                # Check if source should be excluded
-                if source.lower() not in excluded_sources:
-                    sources.append(source)
-                else:
-                    print(f"Excluding filtered source: {source}")
-            elif ' | ' in title:
-                source = title.split(' | ')[-1].strip()
-                # Check if source should be excluded
-                if source.lower() not in excluded_sources:
-                    sources.append(source)
-                else:
-                    print(f"Excluding filtered source: {source}")
-            else:
-                # If no clear separator, try to identify known sources
-                known_sources = [
-                    ('bbc', 'BBC'),
-                    ('cnn', 'CNN'),
-                    ('reuters', 'Reuters'),
-                    ('bloomberg', 'Bloomberg'),
-                    ('wall street journal', 'Wall Street Journal'),
-                    ('wsj', 'Wall Street Journal'),
-                    ('new york times', 'New York Times'),
-                    ('washington post', 'Washington Post'),
-                    ('politico', 'Politico'),
-                    ('axios', 'Axios'),
-                    ('associated press', 'Associated Press'),
-                    ('ap news', 'Associated Press'),
-                    ('npr', 'NPR'),
-                    ('fox news', 'Fox News'),
-                    ('abc news', 'ABC'),
-                    ('cbs news', 'CBS'),
-                    ('nbc news', 'NBC'),
-                    ('usa today', 'USA Today'),
-                    ('time', 'Time'),
-                    ('newsweek', 'Newsweek'),
-                    ('forbes', 'Forbes'),
-                    ('business insider', 'Business Insider'),
-                    ('cnbc', 'CNBC'),
-                    ('marketwatch', 'MarketWatch'),
-                    ('yahoo finance', 'Yahoo Finance'),
-                    ('financial times', 'Financial Times'),
-                    ('ft', 'Financial Times'),
-                    ('the economist', 'The Economist'),
-                    ('foreign policy', 'Foreign Policy'),
-                    ('foreign affairs', 'Foreign Affairs'),
-                    ('csis', 'CSIS'),
-                    ('white & case', 'White & Case'),
-                    ('white house', 'White House'),
-                    ('us trade representative', 'US Trade Representative'),
-                    ('department of commerce', 'Department of Commerce'),
-                ]
-                
-                found_source = False
-                for search_term, proper_name in known_sources:
-                    if search_term in title_lower:
-                        sources.append(proper_name)
-                        found_source = True
-                        break
-                
-                if not found_source:
-                    # Check if it looks like an article title (not a source)
-                    article_indicators = [
-                        'how', 'what', 'when', 'where', 'why', 'analysis', 'report',
-                        'update', 'breaking', 'latest', 'new', 'trump', 'biden'
-                    ]
-                    
-                    is_likely_article = any(indicator in title_lower for indicator in article_indicators)
-                    is_too_long = len(title) > 60  # Long titles are usually articles, not sources
-                    
-                    if not is_likely_article and not is_too_long:
-                        print(f"Skipping unclear source: {title[:50]}...")
+            # Repeated titles (the same article cited by several updates) come from the cache,
+            # with their diagnostic printed again
+            source, message = classify_title(title)
+            if message:
+                print(message)
+            if source is not None:
+                sources.append(source)
         
         # Filter out non-company names using regex patterns and specific exclusions
         filtered_sources = []
@@ -134,14 +185,12 @@ class SourcesListCreator:
             is_non_company = False
             
             # Check regex patterns
-            for pattern in non_company_patterns:
-                if re.match(pattern, source):
-                    print(f"Filtering out non-company name (pattern): {source}")
-                    is_non_company = True
-                    break
+            if NON_COMPANY_RE.match(source):
+                print(f"Filtering out non-company name (pattern): {source}")
+                is_non_company = True
             
             # Check specific excluded abbreviations
-            if not is_non_company and source in excluded_abbreviations:
+            if not is_non_company and source in EXCLUDED_ABBREVIATIONS:
                 print(f"Filtering out non-company name (abbreviation): {source}")
                 is_non_company = True
             
@@ -154,25 +203,21 @@ class SourcesListCreator:
         """Create clean list of source companies from gemini data"""
         all_source_names = set()
         
-        # Extract from gemini_generated_updates
-        updates = gemini_data.get('gemini_generated_updates', [])
-        for update in updates:
-            source_titles = update.get('source_titles', [])
-            source_names = self.extract_source_names(source_titles)
-            all_source_names.update(source_names)
+        # Extract from gemini_generated_updates, merging each update's names straight into the set
+        for update in gemini_data.get('gemini_generated_updates', []):
+            all_source_names.update(self.extract_source_names(update.get('source_titles', [])))
         
-        # Sort and return as list
-        return sorted(list(all_source_names))
+        # Sort and return as list (sorted() already builds a new list)
+        return sorted(all_source_names)
     
-    def update_clean_data_with_sources(self):
-        """Update the clean data file with proper sources list"""
+    def update_clean_data_with_sources(self, pretty: bool = False):
+        """Update the clean data file with proper sources list (pretty also writes an indented .pretty.json copy)"""
         print("🔄 CREATING SOURCES LIST")
         print("=" * 50)
         
         # Load gemini data
         try:
-            with open(self.gemini_file, 'r', encoding='utf-8') as f:
-                gemini_data = json.load(f)
+            gemini_data = load_json_file(self.gemini_file)
             print(f"✅ Loaded gemini data from: {self.gemini_file}")
         except FileNotFoundError:
             print(f"❌ Gemini file not found: {self.gemini_file}")
@@ -183,8 +228,7 @@ class SourcesListCreator:
         
         # Load clean data
         try:
-            with open(self.clean_file, 'r', encoding='utf-8') as f:
-                clean_data = json.load(f)
+            clean_data = load_json_file(self.clean_file)
             print(f"✅ Loaded clean data from: {self.clean_file}")
         except FileNotFoundError:
             print(f"❌ Clean file not found: {self.clean_file}")
@@ -204,8 +248,23 @@ class SourcesListCreator:
         
         # Save updated clean data
         try:
-            with open(self.clean_file, 'w', encoding='utf-8') as f:
-                json.dump(clean_data, f, indent=2, ensure_ascii=False)
+            # Compact JSON - the file is read by eco1.py and the dashboard, not by people
+            if orjson:
+                payload = orjson.dumps(clean_data)
+            else:
+                payload = json.dumps(clean_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            with open(self.clean_file, 'wb') as f:
+                f.write(payload)
+            
+            if pretty:
+                if orjson:
+                    payload = orjson.dumps(clean_data, option=orjson.OPT_INDENT_2)
+                else:
+                    payload = json.dumps(clean_data, indent=2, ensure_ascii=False).encode('utf-8')
+                pretty_file = os.path.splitext(self.clean_file)[0] + '.pretty.json'
+                with open(pretty_file, 'wb') as f:
+                    f.write(payload)
+                print(f"📄 Readable copy saved to: {pretty_file}")
             print(f"\n💾 Updated clean data with sources list")
             print(f"📊 Total sources: {len(sources)}")
             return True
@@ -215,8 +274,12 @@ class SourcesListCreator:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description='Add the clean sources list to tariff_data_clean.json')
+    parser.add_argument('--pretty', action='store_true', help='Also write an indented tariff_data_clean.pretty.json copy for reading')
+    args = parser.parse_args()
+    
     creator = SourcesListCreator()
-    success = creator.update_clean_data_with_sources()
+    success = creator.update_clean_data_with_sources(pretty=args.pretty)
     
     if success:
         print("\n🎉 Sources list creation completed successfully!")
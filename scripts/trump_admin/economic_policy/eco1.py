@@ -5,17 +5,49 @@ Enhanced with Monthly Jobs Chart Data Collection
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime, timedelta
 import re
+import io
 import os
+import sys
 import time
+import threading
 import random
 import calendar
-from typing import Dict, List, Optional
-from collections import Counter
+from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from functools import lru_cache
+from types import MappingProxyType
 from bs4 import BeautifulSoup
 
+# Optional faster JSON decoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional on-disk HTTP cache for the tax tracker's requests
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Optional C HTML parser for the tax-rate page scrapes (BeautifulSoup's html.parser otherwise)
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# Optional one-pass multi-keyword matcher for the bill searches
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -39,29 +71,182 @@ def get_optional_env_var(var_name: str, default_value: str = None, description:
         print(f"⚠️ Optional environment variable '{var_name}' not found. {description}")
     return value
 
-# Import the tariff data from existing file
-try:
-    # First try to load from public/data directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.join(script_dir, '..', '..', '..')
-    public_data_dir = os.path.join(project_root, 'public', 'data')
-    public_tariff_file = os.path.join(public_data_dir, 'tariff_data_clean.json')
+def load_json_file(path: str):
+    """Load a JSON file, parsing the raw bytes with orjson when available"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def response_json(response):
+    """Decode a JSON response body, straight from the bytes with orjson when available"""
+    return orjson.loads(response.content) if orjson else response.json()
+
+@lru_cache(maxsize=None)
+def load_tariff_data():
+    """Tariff data from the existing tariff_data_clean.json file (None if unavailable) - read on first use only"""
+    try:
+        # First try to load from public/data directory
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        project_root = os.path.join(script_dir, '..', '..', '..')
+        public_data_dir = os.path.join(project_root, 'public', 'data')
+        public_tariff_file = os.path.join(public_data_dir, 'tariff_data_clean.json')
+        
+        if os.path.exists(public_tariff_file):
+            tariff_data_clean = load_json_file(public_tariff_file)
+            print("✅ tariff_data_clean.json loaded successfully from public/data")
+        else:
+            # Fallback to local directory
+            tariff_data_clean = load_json_file('tariff_data_clean.json')
+            print("✅ tariff_data_clean.json loaded successfully from local directory")
+        return tariff_data_clean
+    except FileNotFoundError:
+        print("⚠️ tariff_data_clean.json not found in public/data or local directory. Tariff functionality will be limited.")
+        return None
+    except Exception as e:
+        print(f"⚠️ Error loading tariff_data_clean.json: {e}")
+        return None
+
+# Congress.gov bill-detail requests in flight at once (the session pools 32 connections per host)
+CONGRESS_FETCH_WORKERS = 8
+
+# Per-request timeout for Congress.gov calls, and the longest a retry may sleep (backoff or a server's Retry-After)
+CONGRESS_TIMEOUT = 15
+RETRY_WAIT_CAP = 10
+
+# Known 2025 tax rates, used when the IRS and Tax Foundation scrapes both come back empty
+FALLBACK_TAX_RATES = MappingProxyType({
+    'corporate_rate': '21% (TCJA 2017)',
+    'rd_deduction': '5-year amortization (since 2022)',
+    'domestic_production': 'Not available (expired 2017)',
+    'green_credits': 'Available (IRA 2022)',
+    'gilti_rate': '10.5%-13.125% effective',
+    'standard_deduction': '$14,600 single / $29,200 married (2025)',
+    'child_tax_credit': '$2,000 per child',
+    'top_marginal_rate': '37%',
+    'salt_cap': '$10,000 (since 2018)',
+    'ss_cap': '$168,600 (2025)',
+    'capital_gains': '20% (high), 15% (mid), 0% (low)',
+    'estate_exemption': '$13.99 million (2025)',
+    'crypto_treatment': 'Like-kind NOT allowed',
+    'opportunity_zones': 'Available through 2026',
+    'dividend_rate': '20% (qualified, high income)'
+})
+
+# Tax baseline report layout: (JSON section, printed heading, ((rate key, printed label), ...))
+TAX_BASELINE_TABLE = (
+    ("corporate_tax_policy", "🏢 CORPORATE TAX POLICY - Current Rates:", (
+        ('corporate_rate', 'Corporate Tax Rate'),
+        ('rd_deduction', 'R&D Deduction'),
+        ('domestic_production', 'Domestic Production Credit'),
+        ('green_credits', 'Green Energy Credits'),
+        ('gilti_rate', 'Overseas Profit Tax (GILTI)'),
+    )),
+    ("individual_tax_policy", "👤 INDIVIDUAL TAX POLICY - Current Rates:", (
+        ('standard_deduction', 'Standard Deduction (2025)'),
+        ('child_tax_credit', 'Child Tax Credit'),
+        ('top_marginal_rate', 'Top Marginal Rate'),
+        ('salt_cap', 'SALT Deduction Cap'),
+        ('ss_cap', 'Social Security Tax Cap'),
+    )),
+    ("investment_and_capital", "📈 INVESTMENT & CAPITAL - Current Rates:", (
+        ('capital_gains', 'Capital Gains Rate'),
+        ('estate_exemption', 'Estate Tax Exemption'),
+        ('crypto_treatment', 'Crypto Tax Treatment'),
+        ('opportunity_zones', 'Opportunity Zones'),
+        ('dividend_rate', 'Dividend Tax Rate'),
+    )),
+)
+
+# Bill identifiers as used for tracking, e.g. "hr1-119" -> ("hr", "1", "119")
+BILL_ID_RE = re.compile(r'([a-z]+)(\d+)-(\d+)')
+
+def build_keyword_matcher(tokens):
+    """Callable returning which of the tokens occur in a lowercased title - one Aho-Corasick pass when available"""
+    tokens = frozenset(tokens)
+    if ahocorasick is None or not tokens:
+        return lambda title: {token for token in tokens if token in title}
+    automaton = ahocorasick.Automaton()
+    for token in tokens:
+        automaton.add_word(token, token)
+    automaton.make_automaton()
+    return lambda title: {token for _, token in automaton.iter(title)}
+
+class CappedRetry(Retry):
+    """Retry whose waits - exponential backoff or a server's Retry-After - never exceed RETRY_WAIT_CAP seconds"""
+    
+    def get_backoff_time(self):
+        return min(super().get_backoff_time(), RETRY_WAIT_CAP)
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_WAIT_CAP)
+
+class ThreadOutputCapture:
+    """sys.stdout stand-in that sends a worker thread's prints to its own buffer while it runs a step"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def run(self, step):
+        """(printed output, result, exception or None) of step(), run with this thread's prints buffered"""
+        self._local.buffer = io.StringIO()
+        try:
+            result = step()
+            return self._local.buffer.getvalue(), result, None
+        except Exception as e:
+            return self._local.buffer.getvalue(), None, e
+        finally:
+            self._local.buffer = None
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (self.stream if buffer is None else buffer).write(text)
     
-    if os.path.exists(public_tariff_file):
-        with open(public_tariff_file, 'r', encoding='utf-8') as f:
-            tariff_data_clean = json.load(f)
-        print("✅ tariff_data_clean.json loaded successfully from public/data")
-    else:
-        # Fallback to local directory
-        with open('tariff_data_clean.json', 'r', encoding='utf-8') as f:
-            tariff_data_clean = json.load(f)
-        print("✅ tariff_data_clean.json loaded successfully from local directory")
-except FileNotFoundError:
-    print("⚠️ tariff_data_clean.json not found in public/data or local directory. Tariff functionality will be limited.")
-    tariff_data_clean = None
-except Exception as e:
-    print(f"⚠️ Error loading tariff_data_clean.json: {e}")
-    tariff_data_clean = None
+    def flush(self):
+        self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def run_steps_in_order(steps):
+    """Run independent steps on worker threads; returns their results in step order
+    
+    Each step's prints are buffered and written out in step order as soon as it (and every step
+    before it) has finished, so the console reads exactly as if the steps had run one after another.
+    """
+    stdout = sys.stdout
+    capture = ThreadOutputCapture(stdout)
+    sys.stdout = capture
+    try:
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(capture.run, step) for step in steps]
+            results = []
+            for future in futures:
+                output, result, error = future.result()
+                stdout.write(output)
+                if error is not None:
+                    raise error
+                results.append(result)
+            return results
+    finally:
+        sys.stdout = stdout
+
+@contextmanager
+def buffered_output():
+    """Collect everything printed in the block and write it to stdout in one go when the block ends"""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+
+def page_text_lower(content: bytes) -> str:
+    """Lowercased text of an HTML page (the same text BeautifulSoup's get_text gives)"""
+    if lxml_html is not None and content.strip():
+        return lxml_html.fromstring(content).text_content().lower()
+    return BeautifulSoup(content, 'html.parser').get_text().lower()
 
 class FocusedTaxTracker:
     """
@@ -96,11 +281,47 @@ class FocusedTaxTracker:
             raise
         
         self.congress_base_url = "https://api.congress.gov/v3"
-        self.session = requests.Session()
+        # Shared HTTP session - cached on disk when requests-cache is installed: the IRS and Tax Foundation
+        # pages change at most weekly, while Congress.gov and Treasury data is kept for an hour
+        if requests_cache:
+            cache_name = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tax_policy_http_cache")
+            self.session = requests_cache.CachedSession(
+                cache_name,
+                backend="sqlite",
+                expire_after=timedelta(hours=24),
+                urls_expire_after={
+                    'api.congress.gov': timedelta(hours=1),
+                    'api.fiscaldata.treasury.gov': timedelta(hours=1),
+                },
+                cache_control=True,
+                stale_if_error=True
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'X-API-Key': self.congress_api_key,
             'User-Agent': 'Focused-Tax-Tracker/1.0'
         })
+        
+        # Pooled keep-alive connections (Congress.gov, IRS, Tax Foundation, Treasury) with retry/backoff on transient
+        # failures - a 429/503 waits out the server's Retry-After (capped) instead of failing the search outright
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=CappedRetry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET'],
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Latest-bills listing shared by every keyword search (fetched once per run), with its lowercased titles
+        self._bill_listing = None
+        self._bill_listing_lock = threading.Lock()
 
     def print_section(self, title, emoji="📊"):
         """Print formatted section header"""
@@ -122,9 +343,12 @@ class FocusedTaxTracker:
         
         all_corporate_bills = []
         
-        for keyword in corporate_keywords:
+        # Fetch every keyword's bills concurrently, then report them in keyword order
+        searches = self._search_congress_bills_batch(corporate_keywords, limit=3)
+        for keyword, (bills, error) in zip(corporate_keywords, searches):
             print(f"\n🔍 Searching: {keyword}")
-            bills = self._search_congress_bills(keyword, limit=3)
+            if error:
+                print(f"   ❌ Error: {error}")
             
             if bills:
                 for bill in bills:
@@ -156,9 +380,12 @@ class FocusedTaxTracker:
         
         all_individual_bills = []
         
-        for keyword in individual_keywords:
+        # Fetch every keyword's bills concurrently, then report them in keyword order
+        searches = self._search_congress_bills_batch(individual_keywords, limit=3)
+        for keyword, (bills, error) in zip(individual_keywords, searches):
             print(f"\n🔍 Searching: {keyword}")
-            bills = self._search_congress_bills(keyword, limit=3)
+            if error:
+                print(f"   ❌ Error: {error}")
             
             if bills:
                 for bill in bills:
@@ -190,9 +417,12 @@ class FocusedTaxTracker:
         
         all_investment_bills = []
         
-        for keyword in investment_keywords:
+        # Fetch every keyword's bills concurrently, then report them in keyword order
+        searches = self._search_congress_bills_batch(investment_keywords, limit=3)
+        for keyword, (bills, error) in zip(investment_keywords, searches):
             print(f"\n🔍 Searching: {keyword}")
-            bills = self._search_congress_bills(keyword, limit=3)
+            if error:
+                print(f"   ❌ Error: {error}")
             
             if bills:
                 for bill in bills:
@@ -210,36 +440,53 @@ class FocusedTaxTracker:
         
         return all_investment_bills
 
-    def _search_congress_bills(self, query: str, limit: int = 5):
-        """Internal method to search Congress bills"""
+    def _get_bill_listing(self):
+        """(bills, lowercased titles) for the latest Congress.gov bills - every search filters the same page,
+        so it is fetched and its titles lowercased once, then reused"""
+        with self._bill_listing_lock:
+            if self._bill_listing is None:
+                url = f"{self.congress_base_url}/bill"
+                params = {
+                    'format': 'json',
+                    'limit': 50,  # Get more to filter through
+                    'offset': 0
+                }
+                
+                response = self.session.get(url, params=params, timeout=CONGRESS_TIMEOUT)
+                response.raise_for_status()
+                
+                data = response_json(response)
+                bills = data.get('bills', [])
+                self._bill_listing = (bills, [bill.get('title', '').lower() for bill in bills])
+            return self._bill_listing
+    
+    def _search_congress_bills_batch(self, queries: List[str], limit: int = 5):
+        """Search bills for several queries in one pass over the titles; (bills, error) per query, in query order
+        
+        A bill matches a query when any word of the query occurs in its title. Prints nothing, so callers
+        can report each query's results (or error) under their own heading.
+        """
         try:
-            url = f"{self.congress_base_url}/bill"
-            params = {
-                'format': 'json',
-                'limit': 50,  # Get more to filter through
-                'offset': 0
-            }
+            bills, titles = self._get_bill_listing()
             
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
+            # Scan each title once for the words of all queries
+            query_words = [frozenset(query.lower().split()) for query in queries]
+            find_words = build_keyword_matcher(frozenset().union(*query_words))
             
-            data = response.json()
-            bills = data.get('bills', [])
-            
-            # Filter bills by keyword
-            matching_bills = []
-            for bill in bills:
-                title = bill.get('title', '').lower()
-                if any(word in title for word in query.lower().split()):
-                    matching_bills.append(bill)
-                    if len(matching_bills) >= limit:
-                        break
+            # Filter bills by keyword (copies, since callers tag them per search)
+            matches = [[] for _ in queries]
+            for bill, title in zip(bills, titles):
+                found = find_words(title)
+                if not found:
+                    continue
+                for words, matching_bills in zip(query_words, matches):
+                    if len(matching_bills) < limit and not found.isdisjoint(words):
+                        matching_bills.append(dict(bill))
                         
-            return matching_bills
+            return [(matching_bills, None) for matching_bills in matches]
             
         except Exception as e:
-            print(f"   ❌ Error: {e}")
-            return []
+            return [([], e) for _ in queries]
 
     def get_current_policy_status(self):
         """Get current status of major tax policies"""
@@ -253,9 +500,14 @@ class FocusedTaxTracker:
         
         bill_statuses = []
         
-        for bill_id in key_bills:
+        # Fetch every tracked bill concurrently, then report them in list order
+        with ThreadPoolExecutor(max_workers=min(len(key_bills), CONGRESS_FETCH_WORKERS)) as executor:
+            fetched = list(executor.map(self._fetch_specific_bill, key_bills))
+        
+        for bill_id, (bill_data, error) in zip(key_bills, fetched):
             print(f"\n🔍 Tracking: {bill_id.upper()}")
-            bill_data = self._get_specific_bill(bill_id)
+            if error:
+                print(f"   ❌ Error fetching {bill_id}: {error}")
             
             if bill_data:
                 bill = bill_data.get('bill', {})
@@ -268,54 +520,38 @@ class FocusedTaxTracker:
         
         return bill_statuses
 
-    def _get_specific_bill(self, bill_number: str):
-        """Get specific bill details"""
+    def _fetch_specific_bill(self, bill_number: str):
+        """(bill details or None, error or None) for one bill - prints nothing, so it can run on a worker thread"""
         try:
             # Parse bill number (e.g., hr1-119)
-            parts = bill_number.lower().split('-')
-            if len(parts) != 2:
-                return None
-                
-            bill_type_num = parts[0]
-            congress = parts[1]
-            
-            bill_type = ''.join([c for c in bill_type_num if c.isalpha()])
-            bill_num = ''.join([c for c in bill_type_num if c.isdigit()])
+            match = BILL_ID_RE.fullmatch(bill_number.lower())
+            if not match:
+                return None, None
+            bill_type, bill_num, congress = match.groups()
             
             url = f"{self.congress_base_url}/bill/{congress}/{bill_type}/{bill_num}"
-            response = self.session.get(url)
+            response = self.session.get(url, timeout=CONGRESS_TIMEOUT)
             response.raise_for_status()
             
-            return response.json()
+            return response_json(response), None
             
         except Exception as e:
-            print(f"   ❌ Error fetching {bill_number}: {e}")
-            return None
+            return None, e
 
     def search_recent_tax_changes(self):
         """Search for tax changes since January 20, 2025 (Trump inauguration)"""
         self.print_section("RECENT TAX CHANGES (Since Jan 20, 2025)", "🆕")
         
         try:
-            url = f"{self.congress_base_url}/bill"
-            params = {
-                'format': 'json',
-                'limit': 50,
-                'offset': 0
-            }
-            
-            response = self.session.get(url, params=params)
-            data = response.json()
-            bills = data.get('bills', [])
+            bills, titles = self._get_bill_listing()
             
             recent_bills = []
-            for bill in bills:
-                title = bill.get('title', '').lower()
+            for bill, title in zip(bills, titles):
                 intro_date = bill.get('introducedDate', '')
                 
                 # Check if introduced after Jan 20, 2025
                 if intro_date >= '2025-01-20' and 'tax' in title:
-                    recent_bills.append(bill)
+                    recent_bills.append(dict(bill))
             
             if recent_bills:
                 print("✅ Tax bills introduced since Trump inauguration:")
@@ -343,51 +579,13 @@ class FocusedTaxTracker:
         # Try to get current rates from IRS/Treasury APIs or scraping
         current_rates = self._fetch_current_tax_rates()
         
-        print("🏢 CORPORATE TAX POLICY - Current Rates:")
-        print(f"   Corporate Tax Rate: {current_rates.get('corporate_rate', 'Fetching...')}")
-        print(f"   R&D Deduction: {current_rates.get('rd_deduction', 'Fetching...')}")
-        print(f"   Domestic Production Credit: {current_rates.get('domestic_production', 'Fetching...')}")
-        print(f"   Green Energy Credits: {current_rates.get('green_credits', 'Fetching...')}")
-        print(f"   Overseas Profit Tax (GILTI): {current_rates.get('gilti_rate', 'Fetching...')}")
-        
-        print("\n👤 INDIVIDUAL TAX POLICY - Current Rates:")
-        print(f"   Standard Deduction (2025): {current_rates.get('standard_deduction', 'Fetching...')}")
-        print(f"   Child Tax Credit: {current_rates.get('child_tax_credit', 'Fetching...')}")
-        print(f"   Top Marginal Rate: {current_rates.get('top_marginal_rate', 'Fetching...')}")
-        print(f"   SALT Deduction Cap: {current_rates.get('salt_cap', 'Fetching...')}")
-        print(f"   Social Security Tax Cap: {current_rates.get('ss_cap', 'Fetching...')}")
-        
-        print("\n📈 INVESTMENT & CAPITAL - Current Rates:")
-        print(f"   Capital Gains Rate: {current_rates.get('capital_gains', 'Fetching...')}")
-        print(f"   Estate Tax Exemption: {current_rates.get('estate_exemption', 'Fetching...')}")
-        print(f"   Crypto Tax Treatment: {current_rates.get('crypto_treatment', 'Fetching...')}")
-        print(f"   Opportunity Zones: {current_rates.get('opportunity_zones', 'Fetching...')}")
-        print(f"   Dividend Tax Rate: {current_rates.get('dividend_rate', 'Fetching...')}")
-        
-        # Structure the rates into categories for JSON export
-        structured_rates = {
-            "corporate_tax_policy": {
-                "corporate_rate": current_rates.get('corporate_rate', 'N/A'),
-                "rd_deduction": current_rates.get('rd_deduction', 'N/A'),
-                "domestic_production": current_rates.get('domestic_production', 'N/A'),
-                "green_credits": current_rates.get('green_credits', 'N/A'),
-                "gilti_rate": current_rates.get('gilti_rate', 'N/A')
-            },
-            "individual_tax_policy": {
-                "standard_deduction": current_rates.get('standard_deduction', 'N/A'),
-                "child_tax_credit": current_rates.get('child_tax_credit', 'N/A'),
-                "top_marginal_rate": current_rates.get('top_marginal_rate', 'N/A'),
-                "salt_cap": current_rates.get('salt_cap', 'N/A'),
-                "ss_cap": current_rates.get('ss_cap', 'N/A')
-            },
-            "investment_and_capital": {
-                "capital_gains": current_rates.get('capital_gains', 'N/A'),
-                "estate_exemption": current_rates.get('estate_exemption', 'N/A'),
-                "crypto_treatment": current_rates.get('crypto_treatment', 'N/A'),
-                "opportunity_zones": current_rates.get('opportunity_zones', 'N/A'),
-                "dividend_rate": current_rates.get('dividend_rate', 'N/A')
-            }
-        }
+        # Print each category's rates and structure them into categories for JSON export
+        structured_rates = {}
+        for index, (section, heading, rows) in enumerate(TAX_BASELINE_TABLE):
+            print(heading if index == 0 else f"\n{heading}")
+            for key, label in rows:
+                print(f"   {label}: {current_rates.get(key, 'Fetching...')}")
+            structured_rates[section] = {key: current_rates.get(key, 'N/A') for key, _ in rows}
         
         return structured_rates
 
@@ -428,10 +626,8 @@ class FocusedTaxTracker:
             response = self.session.get(irs_url, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
                 # Look for standard deduction amounts
-                text = soup.get_text().lower()
+                text = page_text_lower(response.content)
                 if '2025' in text:
                     # Try to extract standard deduction
                     if 'standard deduction' in text:
@@ -455,8 +651,6 @@ class FocusedTaxTracker:
             response = self.session.get(tf_url, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
                 # Extract current rates from their tables
                 rates['corporate_rate'] = "21% (Tax Foundation confirmed)"
                 rates['capital_gains'] = "20%/15%/0% (based on income)"
@@ -469,23 +663,7 @@ class FocusedTaxTracker:
 
     def _get_fallback_rates(self):
         """Fallback current tax rates when scraping fails"""
-        return {
-            'corporate_rate': '21% (TCJA 2017)',
-            'rd_deduction': '5-year amortization (since 2022)',
-            'domestic_production': 'Not available (expired 2017)',
-            'green_credits': 'Available (IRA 2022)',
-            'gilti_rate': '10.5%-13.125% effective',
-            'standard_deduction': '$14,600 single / $29,200 married (2025)',
-            'child_tax_credit': '$2,000 per child',
-            'top_marginal_rate': '37%',
-            'salt_cap': '$10,000 (since 2018)',
-            'ss_cap': '$168,600 (2025)',
-            'capital_gains': '20% (high), 15% (mid), 0% (low)',
-            'estate_exemption': '$13.99 million (2025)',
-            'crypto_treatment': 'Like-kind NOT allowed',
-            'opportunity_zones': 'Available through 2026',
-            'dividend_rate': '20% (qualified, high income)'
-        }
+        return FALLBACK_TAX_RATES
 
     def display_proposed_changes(self):
         """Search for and display any proposed tax changes"""
@@ -493,9 +671,12 @@ class FocusedTaxTracker:
         
         print("🔍 Searching for proposed tax policy changes...")
         
-        # Search for reconciliation bills
-        reconciliation_bills = self._search_congress_bills("reconciliation", limit=5)
-        tax_bills = self._search_congress_bills("tax reform", limit=5)
+        # Search for reconciliation and tax reform bills (both searches at once)
+        searches = self._search_congress_bills_batch(["reconciliation", "tax reform"], limit=5)
+        for _, error in searches:
+            if error:
+                print(f"   ❌ Error: {error}")
+        (reconciliation_bills, _), (tax_bills, _) = searches
         
         found_proposals = False
         
@@ -535,19 +716,19 @@ class FocusedTaxTracker:
                 'page[size]': 6
             }
             
-            # Remove API key header for Treasury (it's public)
-            headers = {'User-Agent': 'Tax-Policy-Tracker/1.0'}
-            response = requests.get(url, params=params, headers=headers, timeout=15)
+            # Remove API key header for Treasury (it's public) - None drops the session's X-API-Key
+            headers = {'X-API-Key': None, 'User-Agent': 'Tax-Policy-Tracker/1.0'}
+            response = self.session.get(url, params=params, headers=headers, timeout=15)
             
             if response.status_code == 403:
                 print("⚠️ Treasury API access restricted, trying alternative endpoint...")
                 # Try simpler endpoint
                 alt_url = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v2/accounting/od/debt_to_penny"
                 alt_params = {'sort': '-record_date', 'page[size]': 5}
-                response = requests.get(alt_url, params=alt_params, headers=headers, timeout=15)
+                response = self.session.get(alt_url, params=alt_params, headers=headers, timeout=15)
             
             response.raise_for_status()
-            data = response.json()
+            data = response_json(response)
             records = data.get('data', [])
             
             if records:
@@ -583,45 +764,50 @@ class FocusedTaxTracker:
             return []
 
     def run_focused_analysis(self):
-        """Run the complete focused tax policy analysis with real data - focused on essential data"""
-        print("🎯 FOCUSED TAX POLICY TRACKER")
-        print("=" * 50)
-        print(f"Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("Fetching ESSENTIAL tax policy data from external sources")
+        """Run the complete focused tax policy analysis with real data - focused on essential data
+        
+        The report is written in a handful of large writes - the header, each step's output, the summary -
+        instead of one flush per printed line.
+        """
+        with buffered_output():
+            print("🎯 FOCUSED TAX POLICY TRACKER")
+            print("=" * 50)
+            print(f"Report generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            print("Fetching ESSENTIAL tax policy data from external sources")
         
         # Initialize data collection - focus on essential data only
+        # (the steps are independent network fetches, so they run concurrently with their output kept in order)
         analysis_results = {}
+        steps = {
+            # 1. Current baseline rates (ESSENTIAL - save to JSON)
+            'tax_baseline_rates': self.display_current_tax_baseline,
+            # 2. Current policy status - specific bills being tracked (ESSENTIAL - save to JSON)
+            'current_bill_status': self.get_current_policy_status,
+            # 3. Recent changes since inauguration (ESSENTIAL - save to JSON)
+            'recent_tax_changes': self.search_recent_tax_changes,
+            # 4. Proposed changes and tax reform bills (ESSENTIAL - save to JSON)
+            'proposed_changes': self.display_proposed_changes,
+            # 5. Live Treasury data (SUPPLEMENTAL - save to JSON)
+            'treasury_data': self.fetch_live_treasury_data,
+        }
+        analysis_results.update(zip(steps, run_steps_in_order(list(steps.values()))))
         
-        # 1. Current baseline rates (ESSENTIAL - save to JSON)
-        analysis_results['tax_baseline_rates'] = self.display_current_tax_baseline()
-        
-        # 2. Current policy status - specific bills being tracked (ESSENTIAL - save to JSON)
-        analysis_results['current_bill_status'] = self.get_current_policy_status()
-        
-        # 3. Recent changes since inauguration (ESSENTIAL - save to JSON)
-        analysis_results['recent_tax_changes'] = self.search_recent_tax_changes()
-        
-        # 4. Proposed changes and tax reform bills (ESSENTIAL - save to JSON)
-        analysis_results['proposed_changes'] = self.display_proposed_changes()
-        
-        # 5. Live Treasury data (SUPPLEMENTAL - save to JSON)
-        analysis_results['treasury_data'] = self.fetch_live_treasury_data()
-        
-        print(f"\n{'='*60}")
-        print("✅ ESSENTIAL TAX POLICY ANALYSIS COMPLETE!")
+        with buffered_output():
+            print(f"\n{'='*60}")
+            print("✅ ESSENTIAL TAX POLICY ANALYSIS COMPLETE!")
         
-        print("\n📊 Data Sources Used:")
-        print("   • Congress.gov API - Legislative tracking")
-        print("   • Treasury Fiscal Data API - Revenue data")  
-        print("   • IRS.gov - Current tax rates")
-        print("   • Tax Foundation - Policy context")
+            print("\n📊 Data Sources Used:")
+            print("   • Congress.gov API - Legislative tracking")
+            print("   • Treasury Fiscal Data API - Revenue data")  
+            print("   • IRS.gov - Current tax rates")
+            print("   • Tax Foundation - Policy context")
         
-        print("\n💡 Essential Results Summary:")
-        print(f"   • Tax Baseline Rates: {len(analysis_results.get('tax_baseline_rates', {}))} rate categories")
-        print(f"   • Current Bill Status: {len(analysis_results.get('current_bill_status', []))} bills tracked")
-        print(f"   • Recent Changes: {len(analysis_results.get('recent_tax_changes', []))} bills since inauguration")
-        print(f"   • Proposed Changes: Found {len(analysis_results.get('proposed_changes', {}).get('reconciliation_bills', []))} reconciliation + {len(analysis_results.get('proposed_changes', {}).get('tax_bills', []))} tax reform bills")
-        print(f"   • Treasury Data: {len(analysis_results.get('treasury_data', []))} data points")
+            print("\n💡 Essential Results Summary:")
+            print(f"   • Tax Baseline Rates: {len(analysis_results.get('tax_baseline_rates', {}))} rate categories")
+            print(f"   • Current Bill Status: {len(analysis_results.get('current_bill_status', []))} bills tracked")
+            print(f"   • Recent Changes: {len(analysis_results.get('recent_tax_changes', []))} bills since inauguration")
+            print(f"   • Proposed Changes: Found {len(analysis_results.get('proposed_changes', {}).get('reconciliation_bills', []))} reconciliation + {len(analysis_results.get('proposed_changes', {}).get('tax_bills', []))} tax reform bills")
+            print(f"   • Treasury Data: {len(analysis_results.get('treasury_data', []))} data points")
         
         return analysis_results
 
@@ -690,9 +876,11 @@ class FullyIntegratedDataCollector:
         # Initialize specialized components
         self.tax_tracker = FocusedTaxTracker()
         
-        # Initialize tariff data from existing file
-        self.tariff_data = tariff_data_clean
-        
+    @property
+    def tariff_data(self):
+        """Tariff data from the existing tariff_data_clean.json file, loaded on first access"""
+        return load_tariff_data()
+    
     def add_source(self, source_name, source_url=None, data_type=None, description=None):
         """Add a source to the comprehensive source list"""
         source_entry = {